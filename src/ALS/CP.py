@@ -1,14 +1,389 @@
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+from itertools import combinations, permutations
+
+import numpy as np
 from ortools.sat.python import cp_model
-import psutil
+
+from .utils import (
+    DEFAULT_NUM_WORKERS,
+    add_precedences,
+    classify_pairs,
+    extract_plane_arrays,
+    greedy_schedule,
+    impossible_orders,
+    interchangeable_planes,
+    min_separations,
+    satisfies_triangle_inequality,
+    separation_rows,
+    solution_value_lists,
+    solution_values,
+)
+
+# ----------------------------
+# HINTS
+# ----------------------------
+
+def add_schedule_hint(model, variables, planes_data, landing_times, runways=None):
+    """
+    Hints a complete schedule to CP-SAT, not only the landing times.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        variables (dict): A dictionary containing the decision variables.
+        planes_data (list): A list of dictionaries containing plane data.
+        landing_times (list): The landing time of each plane.
+        runways (list): The runway of each plane, or None if unknown.
+    """
+    num_planes = len(landing_times)
+    landing_times = [int(round(t)) for t in landing_times]
+
+    for i in range(num_planes):
+        target_i = planes_data[i]["target_landing_time"]
+        model.AddHint(variables["landing_time"][i], landing_times[i])
+        model.AddHint(variables["early_deviation"][i], max(target_i - landing_times[i], 0))
+        model.AddHint(variables["late_deviation"][i], max(landing_times[i] - target_i, 0))
+
+    # Orders fixed by the time windows are constants. The greedy schedule can break
+    # them (past a latest time, or on another runway), and a hint contradicting a
+    # constant makes CP-SAT drop the whole hint, so they are not hinted.
+    proto_variables = model.Proto().variables
+    for (i, j), literal in variables.get("iBeforeJ", {}).items():
+        domain = proto_variables[literal.Index()].domain
+        if domain[0] == domain[-1]:
+            continue
+        model.AddHint(literal, (landing_times[i], i) < (landing_times[j], j))
+
+    if runways is None:
+        return
+
+    if "runway" in variables:
+        # Runways are numbered in order of first use, to match the symmetry breaking
+        labels = {}
+        for r in runways:
+            labels.setdefault(r, len(labels))
+        runways = [labels[r] for r in runways]
+
+        for i in range(num_planes):
+            model.AddHint(variables["runway"][i], runways[i])
+            for r, literal in enumerate(variables["on_runway"][i]):
+                model.AddHint(literal, runways[i] == r)
+        for (i, j), literal in variables["same_runway"].items():
+            model.AddHint(literal, runways[i] == runways[j])
+
+    # Consecutive planes on the same runway, for the circuit encoding
+    if variables.get("next_plane"):
+        order = sorted(range(num_planes), key=lambda i: (landing_times[i], i))
+        consecutive = set(zip(order, order[1:]))
+        for (i, j), literal in variables["next_plane"].items():
+            model.AddHint(literal, (i, j) in consecutive)
+
+
+def _order_sets(E, L, separation_times):
+    """
+    Finds the plane pairs whose landing order is known before solving.
+
+    Args:
+        E (list): The earliest landing time of each plane.
+        L (list): The latest landing time of each plane.
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        tuple: A tuple containing three sets of (i, j) pairs:
+            - certain_order: i lands before j if they share a runway.
+            - certain_with_no_separation: the pairs of certain_order whose separation
+              is not automatic and has to be enforced.
+            - conflicting: i < j and neither order fits the time windows, so the two
+              planes cannot share a runway.
+    """
+    # Sets W and V: the time windows decide the order, the separation is
+    # automatic for W and has to be enforced for V
+    W, V, _ = classify_pairs(E, L, separation_times)
+    certain_order = set(W) | set(V)
+    certain_with_no_separation = set(V)
+
+    # Pairs where one order cannot respect the separation within the time windows
+    impossible = impossible_orders(E, L, separation_times)
+    conflicting = set()
+    for i, j in combinations(range(len(E)), 2):
+        if (i, j) in certain_order or (j, i) in certain_order:
+            continue
+        if (i, j) in impossible and (j, i) in impossible:
+            conflicting.add((i, j))
+        elif (j, i) in impossible:
+            certain_order.add((i, j))
+            certain_with_no_separation.add((i, j))
+        elif (i, j) in impossible:
+            certain_order.add((j, i))
+            certain_with_no_separation.add((j, i))
+
+    return certain_order, certain_with_no_separation, conflicting
+
+
+def _strategy_variables(variables, var_names, order=None):
+    """
+    Collects the variables a decision strategy branches on.
+
+    Args:
+        variables (dict): A dictionary containing the decision variables.
+        var_names (str or list): The name, or list of names, of the variables.
+        order (list): The plane indices in the order to branch on the per-plane
+            variables, or None for creation order. Pair variables keep creation order.
+
+    Returns:
+        list: The variables, flattened.
+    """
+    if isinstance(var_names, str):
+        var_names = [var_names]
+    elif not isinstance(var_names, list):
+        raise ValueError("The 'variables' field must be a string or list of strings.")
+
+    var_list = []
+    for var_name in var_names:
+        # The position variables were removed, the landing times give the same order
+        if var_name == "position" and var_name not in variables:
+            print("-> 'position' variables no longer exist, branching on 'landing_time'")
+            var_name = "landing_time"
+        if var_name not in variables:
+            raise ValueError(f"Unknown variables '{var_name}' in decision strategy.")
+        group = variables[var_name]
+        # Pair variables are stored in dicts, runway literals in nested lists
+        if isinstance(group, dict):
+            group = group.values()
+        elif order is not None:
+            group = [group[i] for i in order]
+        for item in group:
+            if isinstance(item, list):
+                var_list.extend(item)
+            else:
+                var_list.append(item)
+    return var_list
+
+
+def _add_objective_cut(model, planes_data, separation_times, num_runways, deviations, costs):
+    """
+    Bounds the objective by the cost of the greedy schedule, when that schedule is feasible.
+
+    CP-SAT linear constraints need integer coefficients, so the cut is only added when
+    every penalty is integral.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        num_runways (int): The number of runways.
+        deviations (list): The early deviations followed by the late deviations.
+        costs (list): The penalties of the deviations, in the same order.
+    """
+    if any(cost != int(cost) for cost in costs):
+        return
+
+    landing_times, _ = greedy_schedule(planes_data, separation_times, num_runways)
+    if any(
+        not p["earliest_landing_time"] <= t <= p["latest_landing_time"]
+        for p, t in zip(planes_data, landing_times)
+    ):
+        return
+
+    upper_bound = sum(
+        int(p["penalty_early"]) * max(p["target_landing_time"] - t, 0)
+        + int(p["penalty_late"]) * max(t - p["target_landing_time"], 0)
+        for p, t in zip(planes_data, landing_times)
+    )
+    model.Add(
+        cp_model.LinearExpr.WeightedSum(deviations, [int(cost) for cost in costs])
+        <= upper_bound
+    )
+
+
+def _configure_solver(search_strategy, num_workers, random_seed, time_limit, rel_gap, log, repair_hint=False, linearization_level=None, probing_level=None):
+    """
+    Creates a CP-SAT solver with the parameters shared by the solve functions.
+
+    Args:
+        search_strategy (int): The search_branching value.
+        num_workers (int): The number of search workers, or None for the default.
+        random_seed (int): The random seed of the search.
+        time_limit (float): The time limit in seconds, or None.
+        rel_gap (float): The relative gap to stop at, or None.
+        log (bool): Whether to print the CP-SAT search log.
+        repair_hint (bool): Whether to repair an infeasible solution hint.
+        linearization_level (int): How much of the model goes into the LP relaxation
+            (0 to 2), or None for the CP-SAT default.
+        probing_level (int): The presolve probing effort (0 to 2), or None for the default.
+
+    Returns:
+        cp_model.CpSolver: The configured solver.
+    """
+    solver = cp_model.CpSolver()
+
+    # Set search strategy
+    solver.parameters.search_branching = search_strategy
+
+    # Run the parallel portfolio search, by default with one worker per physical core
+    if num_workers is None:
+        num_workers = DEFAULT_NUM_WORKERS
+    solver.parameters.num_search_workers = num_workers
+    solver.parameters.random_seed = random_seed
+
+    # Bound the solve and optionally print the CP-SAT search log
+    if time_limit is not None:
+        solver.parameters.max_time_in_seconds = time_limit
+    if rel_gap is not None:
+        solver.parameters.relative_gap_limit = rel_gap
+    solver.parameters.log_search_progress = log
+
+    # Repair a hinted schedule (e.g. a greedy one past a latest landing time)
+    # instead of dropping it when it is infeasible
+    solver.parameters.repair_hint = repair_hint
+
+    # A full LP relaxation of the reified separations gives stronger dual bounds,
+    # at the cost of slower propagation
+    if linearization_level is not None:
+        solver.parameters.linearization_level = linearization_level
+    if probing_level is not None:
+        solver.parameters.cp_model_probing_level = probing_level
+
+    return solver
+
+
+def _print_missed_targets(solver, num_planes, planes_data, variables):
+    """
+    Prints the planes of a CP solution that did not land on their target time.
+
+    Args:
+        solver (cp_model.CpSolver): The CP-SAT solver after a successful solve.
+        num_planes (int): The number of planes.
+        planes_data (list): A list of dictionaries containing plane data.
+        variables (dict): A dictionary containing the decision variables.
+    """
+    landing_times, early_deviations, late_deviations = solution_value_lists(
+        solver,
+        variables["landing_time"],
+        variables["early_deviation"],
+        variables["late_deviation"],
+    )
+
+    lines = ["\n-> Planes that did not land on the target time:"]
+    for i in range(num_planes):
+        e_ = early_deviations[i]
+        L_ = late_deviations[i]
+        # If early_deviation or late_deviation > 0, plane missed its target
+        if e_ > 0 or L_ > 0:
+            penalty = (
+                e_ * planes_data[i]["penalty_early"]
+                + L_ * planes_data[i]["penalty_late"]
+            )
+            landing_t = landing_times[i]
+            target_t = planes_data[i]["target_landing_time"]
+            lines.append(
+                f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
+            )
+    print("\n".join(lines))
+
+
+def est_decision_strategies(planes_data, num_runways=1):
+    """
+    Decision strategies that schedule the planes by earliest start time (EST), like the
+    interval default search of the OR-Tools CP solver: in order of earliest landing time,
+    each plane gets the lowest runway and then the earliest landing time left.
+
+    They are only followed strictly with search_strategy=cp_model.FIXED_SEARCH.
+
+    Args:
+        planes_data (list): A list of dictionaries containing plane data.
+        num_runways (int): The number of runways.
+
+    Returns:
+        list: The decision strategies, for the decision_strategies of the solve functions.
+    """
+    est_order = sorted(
+        range(len(planes_data)),
+        key=lambda i: (planes_data[i]["earliest_landing_time"], planes_data[i]["target_landing_time"]),
+    )
+
+    strategies = []
+    if num_runways > 1:
+        strategies.append({
+            "variables": "runway",
+            "variable_strategy": cp_model.CHOOSE_FIRST,
+            "value_strategy": cp_model.SELECT_MIN_VALUE,
+            "order": est_order,
+        })
+    strategies.append({
+        "variables": "landing_time",
+        "variable_strategy": cp_model.CHOOSE_FIRST,
+        "value_strategy": cp_model.SELECT_MIN_VALUE,
+        "order": est_order,
+    })
+    return strategies
+
+
+# Built models keyed by their instance and build options, so that tweak-solve
+# cycles (other hints, strategies or parameters) only pay the build once
+_MODEL_CACHE = {}
+_MODEL_CACHE_SIZE = 8
+
+
+def _hashable(value):
+    """Turns the (nested) lists and dictionaries of an instance into a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, np.ndarray):
+        # Hash the matrix bytes instead of walking its n x n entries in Python
+        digest = hashlib.blake2b(value.tobytes(), digest_size=16).hexdigest()
+        return value.shape, value.dtype.str, digest
+    return value
+
+
+def _copy_variables(value, model):
+    """Looks up the variables of a cached model, by index, in a copy of that model."""
+    if isinstance(value, dict):
+        return {k: _copy_variables(v, model) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_variables(v, model) for v in value]
+    return model.GetIntVarFromProtoIndex(value.Index())
+
+
+def _cached_model(create_model, *args):
+    """
+    Returns a copy of a cached (model, variables) pair, building it on the first call.
+
+    The cached model is never handed out, so the hints, decision strategies and any
+    constraint a caller adds to the returned model do not leak into later solves.
+
+    Args:
+        create_model (function): The create_cp_model_* function to build the model with.
+        *args: The positional arguments of create_model.
+
+    Returns:
+        tuple: A copy of the model and its variables dictionary.
+    """
+    key = (create_model.__name__, _hashable(args))
+
+    if key not in _MODEL_CACHE:
+        if len(_MODEL_CACHE) >= _MODEL_CACHE_SIZE:
+            # Evict the oldest model
+            del _MODEL_CACHE[next(iter(_MODEL_CACHE))]
+        _MODEL_CACHE[key] = create_model(*args)
+
+    model, variables = _MODEL_CACHE[key]
+    copy = model.Clone()
+    return copy, _copy_variables(variables, copy)
+
 
 # ----------------------------
 # SINGLE_RUNWAY
 # ----------------------------
 
-def create_cp_model_single_runway(num_planes, planes_data, separation_times):
+def create_cp_model_single_runway(num_planes, planes_data, separation_times, debug_names=False, circuit=False):
     print("=" * 60)
     print("\t\t     Creating CP model") 
     print("=" * 60, "\n")
+
+    separation_times = separation_rows(separation_times)
     
     # Create the CP-SAT model
     model = cp_model.CpModel()
@@ -16,25 +391,16 @@ def create_cp_model_single_runway(num_planes, planes_data, separation_times):
     # ------------------------------------------------------------------
     # 1) EXTRACT RELEVANT DATA INTO ARRAYS (for convenience)
     # ------------------------------------------------------------------
-    E = [p["earliest_landing_time"] for p in planes_data]  # Earliest landing times
-    T = [p["target_landing_time"]   for p in planes_data]  # Target landing times
-    L = [p["latest_landing_time"]   for p in planes_data]  # Latest landing times
-    cost_e = [p["penalty_early"]    for p in planes_data]  # Penalty for early_deviation
-    cost_l = [p["penalty_late"]     for p in planes_data]  # Penalty for late_deviation
+    # Earliest, target and latest landing times, and early/late penalty costs
+    E, T, L, cost_e, cost_l = extract_plane_arrays(planes_data)
 
     # ------------------------------------------------------------------
     # 2) VARIABLE CREATION
     # ------------------------------------------------------------------
 
-    # 'position[i]' determines the landing order of plane i
-    position = [
-        model.NewIntVar(0, num_planes - 1, f"position_{i}")
-        for i in range(num_planes)
-    ]
-
-    # 'landing_time[i]' is the time plane i actually lands
+    # 'landing_time[i]' is the time plane i actually lands, within [E[i], L[i]]
     landing_time = [
-        model.NewIntVar(0, 10_000_000, f"landing_time_{i}")
+        model.NewIntVar(E[i], L[i], f"landing_time_{i}")
         for i in range(num_planes)
     ]
 
@@ -54,101 +420,171 @@ def create_cp_model_single_runway(num_planes, planes_data, separation_times):
             f"late_deviation_{i}")
         for i in range(num_planes)]
 
-    # Boolean variables: iBeforeJ[i][j] = True if plane i lands before plane j (i < j).
-    # We'll store these in a 2D list for convenience.
-    iBeforeJ = []
-    for i in range(num_planes):
-        row = []
-        for j in range(num_planes):
-            if j > i:
-                # Only define it for j > i to avoid duplication
-                row.append(model.NewBoolVar(f"iBeforeJ_{i}_{j}"))
-            else:
-                # For j <= i, we can store None (or a dummy variable)
-                row.append(None)
-        iBeforeJ.append(row)
+    # Pairs whose order is already decided by the time windows (sets W and V, and
+    # pairs where only one order can respect the separation)
+    certain_order, certain_with_no_separation, conflicting = _order_sets(
+        E, L, separation_times
+    )
+
+    if conflicting:
+        print("-> Some planes cannot be separated on a single runway, the model is infeasible\n")
+
+    # The circuit encoding only separates consecutive landings, which separates
+    # every pair only when the separation times satisfy the triangle inequality
+    use_circuit = circuit and satisfies_triangle_inequality(separation_times)
+    if circuit and not use_circuit:
+        print("-> Separation times violate the triangle inequality, using pairwise separation\n")
+
+    # Boolean variables: iBeforeJ[i, j] = True if plane i lands before plane j (i < j).
+    # Only pairs with i < j are stored, and for pairs with a certain order
+    # it is a constant instead of a variable.
+    iBeforeJ = {} if use_circuit else {
+        (i, j): (
+            model.NewConstant(1) if (i, j) in certain_order
+            else model.NewConstant(0) if (j, i) in certain_order
+            else model.NewBoolVar(f"iBeforeJ_{i}_{j}" if debug_names else "")
+        )
+        for i, j in combinations(range(num_planes), 2)
+    }
+
+    # Boolean variables: next_plane[i, j] = True if plane j lands right after plane i
+    # (circuit encoding only). There is no arc from i to j if j certainly lands first.
+    next_plane = {
+        (i, j): model.NewBoolVar(f"next_plane_{i}_{j}" if debug_names else "")
+        for i, j in permutations(range(num_planes), 2)
+        if use_circuit and (j, i) not in certain_order
+    }
 
     # ------------------------------------------------------------------
     # 3) CONSTRAINTS
     # ------------------------------------------------------------------
 
-    # (3.1) All-Different for positions to enforce a permutation
-    model.AddAllDifferent(position)
+    # (3.1) The landing order is given by iBeforeJ (or next_plane with the circuit
+    # encoding), no explicit permutation is needed
 
-    # (3.2) Earliest/latest landing time constraints
-    for i in range(num_planes):
-        model.Add(landing_time[i] >= E[i])  # no earlier than E[i]
-        model.Add(landing_time[i] <= L[i])  # no later than L[i]
+    # (3.2) Earliest/latest landing times are the domain of landing_time
 
-    # (3.3) early_deviation / late_deviation definitions
-    for i in range(num_planes):
-        model.Add(early_deviation[i] >= T[i] - landing_time[i])
-        model.Add(early_deviation[i] >= 0)
-        model.Add(late_deviation[i]  >= landing_time[i] - T[i])
-        model.Add(late_deviation[i]  >= 0)
-
-    # (3.4) Separation constraints using the boolean iBeforeJ
-    # For each pair (i, j) with i < j, if plane i lands before j, then
-    # landing_time[j] >= landing_time[i] + separation_times[i][j].
-    # Otherwise, landing_time[i] >= landing_time[j] + separation_times[j][i].
+    # (3.3) early_deviation / late_deviation definitions (>= 0 is their domain):
+    # a single channeling constraint landing_time[i] - T[i] == late - early
     for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            # iBeforeJ[i][j] <-> (position[i] < position[j])
-            model.Add(position[i] < position[j]).OnlyEnforceIf(iBeforeJ[i][j])
-            model.Add(position[i] >= position[j]).OnlyEnforceIf(iBeforeJ[i][j].Not())
+        model.Add(landing_time[i] - T[i] == late_deviation[i] - early_deviation[i])
 
-            # If i lands before j:
+    # (3.4) Separation constraints
+    if use_circuit:
+        # The landing sequence is a Hamiltonian circuit through a dummy node 0,
+        # node i + 1 being plane i. Each arc taken separates two consecutive planes.
+        arcs = []
+        for i in range(num_planes):
+            arcs.append((0, i + 1, model.NewBoolVar(f"first_plane_{i}" if debug_names else "")))
+            arcs.append((i + 1, 0, model.NewBoolVar(f"last_plane_{i}" if debug_names else "")))
+        for (i, j), literal in next_plane.items():
+            arcs.append((i + 1, j + 1, literal))
             model.Add(
                 landing_time[j] >= landing_time[i] + separation_times[i][j]
-            ).OnlyEnforceIf(iBeforeJ[i][j])
+            ).OnlyEnforceIf(literal)
+        model.AddCircuit(arcs)
+    else:
+        # Separation constraints using the boolean iBeforeJ
+        # For each pair (i, j) with i < j, if plane i lands before j, then
+        # landing_time[j] >= landing_time[i] + separation_times[i][j].
+        # Otherwise, landing_time[i] >= landing_time[j] + separation_times[j][i].
+        # Pairs with a certain order only need the separation when it is not automatic (V).
+        precedences = []
+        add_precedence = precedences.append
+        for i in range(num_planes):
+            lt_i, sep_i = landing_time[i], separation_times[i]
+            for j in range(i + 1, num_planes):
+                lt_j, sep_j = landing_time[j], separation_times[j]
+
+                if (i, j) in certain_order:
+                    if (i, j) in certain_with_no_separation:
+                        add_precedence((lt_i, lt_j, sep_i[j], ()))
+                    continue
+                if (j, i) in certain_order:
+                    if (j, i) in certain_with_no_separation:
+                        add_precedence((lt_j, lt_i, sep_j[i], ()))
+                    continue
+
+                before_ij = iBeforeJ[i, j]
+
+                # If i lands before j:
+                add_precedence((lt_i, lt_j, sep_i[j], (before_ij,)))
+
+                # If j lands before i:
+                add_precedence((lt_j, lt_i, sep_j[i], (before_ij.Not(),)))
+        add_precedences(model, precedences)
+
+    # (3.5) Redundant disjunctive constraint over the landing intervals (see min_separations)
+    min_separation = min_separations(separation_times)
+    landing_interval = [
+        model.NewFixedSizeIntervalVar(
+            landing_time[i], min_separation[i], f"landing_interval_{i}" if debug_names else ""
+        )
+        for i in range(num_planes)
+    ]
+    model.AddNoOverlap(landing_interval)
 
-            # If j lands before i:
-            model.Add(
-                landing_time[i] >= landing_time[j] + separation_times[j][i]
-            ).OnlyEnforceIf(iBeforeJ[i][j].Not())
+    # (3.6) Symmetry breaking: interchangeable planes land in index order
+    for group in interchangeable_planes(planes_data, separation_times):
+        for i, j in zip(group, group[1:]):
+            model.Add(landing_time[i] <= landing_time[j])
 
     # ------------------------------------------------------------------
     # 4) OBJECTIVE FUNCTION: MINIMIZE TOTAL early_deviation + late_deviation COST
     # ------------------------------------------------------------------
-    cost_terms = []
-    for i in range(num_planes):
-        cost_terms.append(cost_e[i] * early_deviation[i])
-        cost_terms.append(cost_l[i] * late_deviation[i])
+    model.Minimize(
+        cp_model.LinearExpr.WeightedSum(early_deviation + late_deviation, cost_e + cost_l)
+    )
 
-    model.Minimize(sum(cost_terms))
+    # Redundant cut: the optimum costs no more than the greedy schedule
+    _add_objective_cut(
+        model, planes_data, separation_times, 1,
+        early_deviation + late_deviation, cost_e + cost_l
+    )
 
     # ------------------------------------------------------------------
     # 5) RETURN MODEL AND VARIABLES
     # ------------------------------------------------------------------
     variables = {
-        "position": position,
         "landing_time": landing_time,
         "early_deviation": early_deviation,
         "late_deviation": late_deviation,
-        "iBeforeJ": iBeforeJ
+        "iBeforeJ": iBeforeJ,
+        "next_plane": next_plane
     }
 
     return model, variables
 
 
-def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_strategies=None,hint=False, search_strategy=cp_model.AUTOMATIC_SEARCH):
+def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_strategies=None,hint=False, search_strategy=cp_model.AUTOMATIC_SEARCH, debug_names=False, num_workers=None, warm_start=None, random_seed=0, circuit=False, time_limit=None, rel_gap=None, log=False, reuse_model=True, linearization_level=None, probing_level=None):
     """Builds and solves the single-runway CP model with a permutation approach."""
-    model, vars_ = create_cp_model_single_runway(
-        num_planes, planes_data, separation_times
-    )
-
-    if hint:
-        for i in range(num_planes):
-            model.AddHint(vars_["landing_time"][i], planes_data[i]["target_landing_time"])
+    if reuse_model:
+        model, vars_ = _cached_model(
+            create_cp_model_single_runway,
+            num_planes, planes_data, separation_times, debug_names, circuit
+        )
+    else:
+        model, vars_ = create_cp_model_single_runway(
+            num_planes, planes_data, separation_times, debug_names, circuit
+        )
 
-    # Create solver instance
-    solver = cp_model.CpSolver()
+    # A warm start (e.g. the landing times of a MIP solution) replaces the greedy hint
+    if warm_start is not None:
+        add_schedule_hint(model, vars_, planes_data, warm_start)
+    elif hint:
+        landing_times, runways = greedy_schedule(planes_data, separation_times)
+        add_schedule_hint(model, vars_, planes_data, landing_times, runways)
 
-    # Set search strategy
-    solver.parameters.search_branching = search_strategy
+    # Create the solver
+    solver = _configure_solver(
+        search_strategy, num_workers, random_seed, time_limit, rel_gap, log,
+        repair_hint=hint or warm_start is not None,
+        linearization_level=linearization_level, probing_level=probing_level,
+    )
 
-    print("-> Number of decision variables created:", len(model.Proto().variables))
-    print("-> Number of constraints:", len(model.Proto().constraints))
+    proto = model.Proto()
+    print("-> Number of decision variables created:", len(proto.variables))
+    print("-> Number of constraints:", len(proto.constraints))
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving CP")
@@ -157,20 +593,9 @@ def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_s
 
     if decision_strategies:
         for strategy in decision_strategies:
-            # Obter as variáveis a partir do nome fornecido
-            var_names = strategy["variables"]
-            if isinstance(var_names, str):
-                var_list = vars_.get(var_names, [])
-            elif isinstance(var_names, list):
-                var_list = []
-                for var_name in var_names:
-                    var_list.extend(vars_.get(var_name, []))
-            else:
-                raise ValueError("The 'variables' field must be a string or list of strings.")
-            
             # Aplicar a estratégia ao conjunto de variáveis
             model.AddDecisionStrategy(
-                var_list,
+                _strategy_variables(vars_, strategy["variables"], strategy.get("order")),
                 strategy["variable_strategy"],
                 strategy["value_strategy"]
             )
@@ -178,33 +603,13 @@ def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_s
     # Solve the model with performance tracking
     status = solver.Solve(model)
 
-    position = vars_["position"]
-    landing_time = vars_["landing_time"]
-    early_deviation = vars_["early_deviation"]
-    late_deviation = vars_["late_deviation"]
-    
     if status == cp_model.OPTIMAL:
         # -------------------------------
         # Print as if it were MIP's OPTIMAL
         # -------------------------------
         print(f"-> Optimal Cost: {solver.ObjectiveValue()}")
 
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(solver, num_planes, planes_data, vars_)
 
     elif status == cp_model.FEASIBLE:
         # -------------------------------
@@ -213,20 +618,7 @@ def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_s
         print("-> Best feasible solution found:", round(solver.ObjectiveValue(), 2))
 
         # You can optionally also list planes that missed their target
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            if e_ > 0 or L_ > 0:
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(solver, num_planes, planes_data, vars_)
 
     else:
         print("-> No feasible/optimal solution found. Status:", solver.StatusName(status))
@@ -238,31 +630,28 @@ def solve_single_runway_cp(num_planes, planes_data, separation_times, decision_s
 # ----------------------------
 
 
-def create_cp_model_multiple_runways(num_planes, num_runways, planes_data, separation_times):
+def create_cp_model_multiple_runways(num_planes, num_runways, planes_data, separation_times, debug_names=False):
     print("=" * 60)
     print("\t\t     Creating CP model")
     print("=" * 60, "\n")
 
+    separation_times = separation_rows(separation_times)
+
     # Create the CP-SAT model
     model = cp_model.CpModel()
 
     # ---------------------
     # DATA EXTRACTION
     # ---------------------
-    E = [p["earliest_landing_time"] for p in planes_data]  # Earliest possible landing time for each plane
-    T = [p["target_landing_time"] for p in planes_data]    # Target landing time for each plane
-    L = [p["latest_landing_time"] for p in planes_data]    # Latest possible landing time for each plane
-    cost_e = [p["penalty_early"] for p in planes_data]     # Penalty cost for early landing
-    cost_l = [p["penalty_late"] for p in planes_data]      # Penalty cost for late landing
+    # Earliest, target and latest landing times, and early/late penalty costs
+    E, T, L, cost_e, cost_l = extract_plane_arrays(planes_data)
 
     # ---------------------
     # VARIABLE CREATION
     # ---------------------
-    # 'position[i]' is the landing order of plane i (0 means lands first, etc.)
-    position = [model.NewIntVar(0, num_planes - 1, f"position_{i}") for i in range(num_planes)]
-    
-    # 'landing_time[i]' is the integer variable indicating the time plane i lands
-    landing_time = [model.NewIntVar(0, 10000000, f"landing_time_{i}") for i in range(num_planes)]
+    # 'landing_time[i]' is the integer variable indicating the time plane i lands,
+    # its domain [E[i], L[i]] is the time window of the plane
+    landing_time = [model.NewIntVar(E[i], L[i], f"landing_time_{i}") for i in range(num_planes)]
     
     # 'early_deviation[i]' is the non-negative amount of time plane i lands before its target
     early_deviation = [model.NewIntVar(0, max(T[i] - E[i], 0), f"early_deviation_{i}") for i in range(num_planes)]
@@ -273,91 +662,164 @@ def create_cp_model_multiple_runways(num_planes, num_runways, planes_data, separ
     # 'runway[i]' is the index of the runway on which plane i lands
     runway = [model.NewIntVar(0, num_runways - 1, f"runway_{i}") for i in range(num_planes)]
 
+    # 'on_runway[i][r]' = True if plane i lands on runway r (one-hot encoding of runway[i])
+    on_runway = [
+        [model.NewBoolVar(f"on_runway_{i}_{r}" if debug_names else "") for r in range(num_runways)]
+        for i in range(num_planes)
+    ]
+
+    # 'runway_interval[i][r]' is the optional landing interval of plane i on runway r,
+    # for the redundant disjunctive constraint per runway (see min_separations)
+    min_separation = min_separations(separation_times)
+    runway_interval = [
+        [
+            model.NewOptionalFixedSizeIntervalVar(
+                landing_time[i],
+                min_separation[i],
+                on_runway[i][r],
+                f"runway_interval_{i}_{r}" if debug_names else "",
+            )
+            for r in range(num_runways)
+        ]
+        for i in range(num_planes)
+    ]
+
+    # Pairs whose order is already decided by the time windows (sets W and V, and
+    # pairs where only one order can respect the separation)
+    certain_order, certain_with_no_separation, conflicting = _order_sets(
+        E, L, separation_times
+    )
+
     # ---------------------
     # BOOLEAN VARIABLE CREATION
     # ---------------------
-    # We create 2D lists for the boolean variables iBeforeJ and same_runway
-    # iBeforeJ[i][j] = True if plane i is before plane j in the order
-    # same_runway[i][j] = True if plane i and plane j land on the same runway
-    iBeforeJ = []
-    same_runway = []
-
-    for i in range(num_planes):
-        iBeforeJ.append([])
-        same_runway.append([])
-        for j in range(num_planes):
-            if j > i:
-                iBeforeJ[i].append(model.NewBoolVar(f"iBeforeJ_{i}_{j}"))
-                same_runway[i].append(model.NewBoolVar(f"same_runway_{i}_{j}"))
-            else:
-                # To keep indices consistent, you might store None or a dummy variable for j <= i
-                iBeforeJ[i].append(None)
-                same_runway[i].append(None)
+    # We create dicts keyed by (i, j) with i < j for the boolean variables iBeforeJ and same_runway
+    # iBeforeJ[i, j] = True if plane i is before plane j in the order
+    # (a constant for pairs with a certain order)
+    # same_runway[i, j] = True if plane i and plane j land on the same runway
+    iBeforeJ = {
+        (i, j): (
+            model.NewConstant(1) if (i, j) in certain_order
+            else model.NewConstant(0) if (j, i) in certain_order
+            else model.NewBoolVar(f"iBeforeJ_{i}_{j}" if debug_names else "")
+        )
+        for i, j in combinations(range(num_planes), 2)
+    }
+    same_runway = {
+        (i, j): model.NewBoolVar(f"same_runway_{i}_{j}" if debug_names else "")
+        for i, j in combinations(range(num_planes), 2)
+    }
 
     # ---------------------
     # CONSTRAINTS
     # ---------------------
 
-    # All planes must have different 'position' (each plane has a unique landing order).
-    model.AddAllDifferent(position)
+    # Each plane lands on exactly one runway, and runway[i] is the index of that runway
+    for i in range(num_planes):
+        model.AddExactlyOne(on_runway[i])
+        model.Add(runway[i] == cp_model.LinearExpr.WeightedSum(on_runway[i], range(num_runways)))
+
+    # Symmetry breaking: the runways are identical, so they are numbered in order of
+    # first use by the planes (value precedence), which gives runway[i] <= i
+    for i in range(min(num_planes, num_runways - 1)):
+        model.Add(runway[i] <= i)
+
+    # Planes on the same runway cannot overlap, which is a relaxation of the
+    # separation constraints below that CP-SAT propagates much more strongly
+    for r in range(num_runways):
+        model.AddNoOverlap([runway_interval[i][r] for i in range(num_planes)])
+
+    # Redundant cumulative constraint: whatever the runways, at most num_runways
+    # landing intervals overlap at any time. It gives CP-SAT the timetable and
+    # energetic reasoning over all planes at once, before runways are assigned.
+    landing_interval = [
+        model.NewFixedSizeIntervalVar(
+            landing_time[i], min_separation[i], f"landing_interval_{i}" if debug_names else ""
+        )
+        for i in range(num_planes)
+    ]
+    model.AddCumulative(landing_interval, [1] * num_planes, num_runways)
 
-    # Time window constraints: each plane i must land between its earliest and latest times
-    # Also, define early_deviation and late_deviation relative to the target time
+    # Time windows are enforced by the landing_time domains, and the deviations
+    # are non-negative by their domains
+    # Define early_deviation and late_deviation relative to the target time
     for i in range(num_planes):
-        # landing_time[i] >= earliest landing time
-        model.Add(landing_time[i] >= E[i])
-        # landing_time[i] <= latest landing time
-        model.Add(landing_time[i] <= L[i])
-        # early_deviation[i] >= T[i] - landing_time[i] (early if we land before target)
-        model.Add(early_deviation[i] >= T[i] - landing_time[i])
-        # early_deviation[i] >= 0
-        model.Add(early_deviation[i] >= 0)
-        # late_deviation[i] >= landing_time[i] - T[i] (late if we land after target)
-        model.Add(late_deviation[i] >= landing_time[i] - T[i])
-        # late_deviation[i] >= 0
-        model.Add(late_deviation[i] >= 0)
+        # landing_time[i] - T[i] == late_deviation[i] - early_deviation[i]
+        # (the objective keeps at most one of them positive)
+        model.Add(landing_time[i] - T[i] == late_deviation[i] - early_deviation[i])
 
     # Separation constraints: if plane i lands before j on the same runway,
     # landing_time[j] must be at least landing_time[i] + separation_times[i][j], and vice-versa
+    # Pairs with a certain order only need the separation when it is not automatic (V).
+    precedences = []
+    add_precedence = precedences.append
+    add_bool_or = model.AddBoolOr
+    off_runway = [[literal.Not() for literal in on_runway[i]] for i in range(num_planes)]
     for i in range(num_planes):
+        lt_i, sep_i, off_i = landing_time[i], separation_times[i], off_runway[i]
         for j in range(i + 1, num_planes):
-            # iBeforeJ[i][j] = True if plane i is before j
-            model.Add(position[i] < position[j]).OnlyEnforceIf(iBeforeJ[i][j])
-            model.Add(position[i] >= position[j]).OnlyEnforceIf(iBeforeJ[i][j].Not())
-
-            # same_runway[i][j] = True if plane i and j use the same runway
-            model.Add(runway[i] == runway[j]).OnlyEnforceIf(same_runway[i][j])
-            model.Add(runway[i] != runway[j]).OnlyEnforceIf(same_runway[i][j].Not())
+            lt_j, sep_j, on_j = landing_time[j], separation_times[j], on_runway[j]
+            off_j = off_runway[j]
+            same_ij = same_runway[i, j]
+            not_same_ij = same_ij.Not()
+
+            # same_runway[i, j] = True if plane i and j use the same runway,
+            # i.e. (on_runway[i][r] and on_runway[j][r]) for some runway r
+            for r in range(num_runways):
+                add_bool_or([off_i[r], off_j[r], same_ij])
+                add_bool_or([off_i[r], on_j[r], not_same_ij])
+
+            # Neither order fits the time windows, so they land on different runways
+            if (i, j) in conflicting:
+                model.Add(same_ij == 0)
+                continue
+
+            if (i, j) in certain_order:
+                if (i, j) in certain_with_no_separation:
+                    add_precedence((lt_i, lt_j, sep_i[j], (same_ij,)))
+                continue
+            if (j, i) in certain_order:
+                if (j, i) in certain_with_no_separation:
+                    add_precedence((lt_j, lt_i, sep_j[i], (same_ij,)))
+                continue
+
+            before_ij = iBeforeJ[i, j]
 
             # If plane i is before j and they share the same runway, impose separation times
-            model.Add(landing_time[j] >= landing_time[i] + separation_times[i][j])\
-                 .OnlyEnforceIf(iBeforeJ[i][j])\
-                 .OnlyEnforceIf(same_runway[i][j])
+            add_precedence((lt_i, lt_j, sep_i[j], (before_ij, same_ij)))
 
             # If plane j is before i and they share the same runway, impose separation times
-            model.Add(landing_time[i] >= landing_time[j] + separation_times[j][i])\
-                 .OnlyEnforceIf(iBeforeJ[i][j].Not())\
-                 .OnlyEnforceIf(same_runway[i][j])
+            add_precedence((lt_j, lt_i, sep_j[i], (before_ij.Not(), same_ij)))
+    add_precedences(model, precedences)
+
+    # Symmetry breaking: interchangeable planes land in index order
+    for group in interchangeable_planes(planes_data, separation_times):
+        for i, j in zip(group, group[1:]):
+            model.Add(landing_time[i] <= landing_time[j])
 
     # ---------------------
     # OBJECTIVE FUNCTION
     # ---------------------
     # Minimize the total cost of early_deviation and late_deviation
-    cost_terms = []
-    for i in range(num_planes):
-        cost_terms.append(cost_e[i] * early_deviation[i])
-        cost_terms.append(cost_l[i] * late_deviation[i])
-    model.Minimize(sum(cost_terms))
+    model.Minimize(
+        cp_model.LinearExpr.WeightedSum(early_deviation + late_deviation, cost_e + cost_l)
+    )
+
+    # Redundant cut: the optimum costs no more than the greedy schedule
+    _add_objective_cut(
+        model, planes_data, separation_times, num_runways,
+        early_deviation + late_deviation, cost_e + cost_l
+    )
 
     # ---------------------
     # RETURN MODEL & VARS
     # ---------------------
     variables = {
-        "position": position,
         "landing_time": landing_time,
         "early_deviation": early_deviation,
         "late_deviation": late_deviation,
         "runway": runway,
+        "on_runway": on_runway,
         "iBeforeJ": iBeforeJ,
         "same_runway": same_runway
     }
@@ -367,28 +829,32 @@ def create_cp_model_multiple_runways(num_planes, num_runways, planes_data, separ
     return model, variables
 
 
-def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_times, decision_strategies=None, hint=False,search_strategy=cp_model.AUTOMATIC_SEARCH):
+def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_times, decision_strategies=None, hint=False,search_strategy=cp_model.AUTOMATIC_SEARCH, debug_names=False, num_workers=None, warm_start=None, random_seed=0, time_limit=None, rel_gap=None, log=False, reuse_model=True, linearization_level=None, probing_level=None):
     # Create the model and variables
-    model, vars_ = create_cp_model_multiple_runways(
-        num_planes,
-        num_runways,
-        planes_data,
-        separation_times
-    )
+    create_args = (num_planes, num_runways, planes_data, separation_times, debug_names)
+    if reuse_model:
+        model, vars_ = _cached_model(create_cp_model_multiple_runways, *create_args)
+    else:
+        model, vars_ = create_cp_model_multiple_runways(*create_args)
 
-    if hint:
-        for i in range(num_planes):
-            model.AddHint(vars_["landing_time"][i], planes_data[i]["target_landing_time"])
+    # A warm start (e.g. the landing times of a MIP solution) replaces the greedy hint
+    if warm_start is not None:
+        add_schedule_hint(model, vars_, planes_data, warm_start)
+    elif hint:
+        landing_times, runways = greedy_schedule(planes_data, separation_times, num_runways)
+        add_schedule_hint(model, vars_, planes_data, landing_times, runways)
 
     # Create the solver
-    solver = cp_model.CpSolver()
-    
-    # Set search strategy
-    solver.parameters.search_branching = search_strategy
+    solver = _configure_solver(
+        search_strategy, num_workers, random_seed, time_limit, rel_gap, log,
+        repair_hint=hint or warm_start is not None,
+        linearization_level=linearization_level, probing_level=probing_level,
+    )
 
 
-    print("-> Number of decision variables created:", len(model.Proto().variables))
-    print("-> Number of constraints:", len(model.Proto().constraints))
+    proto = model.Proto()
+    print("-> Number of decision variables created:", len(proto.variables))
+    print("-> Number of constraints:", len(proto.constraints))
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving CP")
@@ -396,20 +862,9 @@ def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_t
 
     if decision_strategies:
         for strategy in decision_strategies:
-            # Obter as variáveis a partir do nome fornecido
-            var_names = strategy["variables"]
-            if isinstance(var_names, str):
-                var_list = vars_.get(var_names, [])
-            elif isinstance(var_names, list):
-                var_list = []
-                for var_name in var_names:
-                    var_list.extend(vars_.get(var_name, []))
-            else:
-                raise ValueError("The 'variables' field must be a string or list of strings.")
-
             # Aplicar a estratégia ao conjunto de variáveis
             model.AddDecisionStrategy(
-                var_list,
+                _strategy_variables(vars_, strategy["variables"], strategy.get("order")),
                 strategy["variable_strategy"],
                 strategy["value_strategy"]
             )
@@ -417,13 +872,6 @@ def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_t
     # Solve the model
     status = solver.Solve(model)
 
-    # Unpack variables for easy reference
-    position = vars_["position"]
-    landing_time = vars_["landing_time"]
-    early_deviation = vars_["early_deviation"]
-    late_deviation = vars_["late_deviation"]
-    runway = vars_["runway"]
-
     # 1) Check solver status for CP-SAT
     if status == cp_model.OPTIMAL:
         # -------------------------------
@@ -431,22 +879,7 @@ def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_t
         # -------------------------------
         print(f"-> Optimal Cost: {solver.ObjectiveValue()}")
 
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(solver, num_planes, planes_data, vars_)
 
     elif status == cp_model.FEASIBLE:
         # -------------------------------
@@ -456,23 +889,181 @@ def solve_multiple_runways_cp(num_planes, num_runways, planes_data, separation_t
         print("-> Best feasible solution found:", round(solver.ObjectiveValue(), 2))
 
         # You can optionally also list planes that missed their target
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            if e_ > 0 or L_ > 0:
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(solver, num_planes, planes_data, vars_)
     else:
         print("-> No feasible/optimal solution found. Status:", solver.StatusName(status))
 
     # Return solver
     return solver, model
 
+
+# ----------------------------
+# PORTFOLIO
+# ----------------------------
+
+PORTFOLIO_STRATEGIES = [
+    cp_model.AUTOMATIC_SEARCH,
+    cp_model.FIXED_SEARCH,
+    cp_model.PORTFOLIO_SEARCH,
+    cp_model.LP_SEARCH,
+    cp_model.PSEUDO_COST_SEARCH,
+    cp_model.PORTFOLIO_WITH_QUICK_RESTART_SEARCH,
+]
+
+
+def _solve_with_strategy(num_planes, num_runways, planes_data, separation_times, search_strategy, time_limit, hint):
+    """Solves one portfolio entry in a worker process and returns picklable results."""
+    if num_runways == 1:
+        solver, _, _ = solve_single_runway_cp(
+            num_planes, planes_data, separation_times, hint=hint,
+            search_strategy=search_strategy, num_workers=1, time_limit=time_limit
+        )
+    else:
+        solver, _ = solve_multiple_runways_cp(
+            num_planes, num_runways, planes_data, separation_times, hint=hint,
+            search_strategy=search_strategy, num_workers=1, time_limit=time_limit
+        )
+
+    status = solver.StatusName()
+    has_solution = status in ("OPTIMAL", "FEASIBLE")
+    return {
+        "search_strategy": search_strategy,
+        "status": status,
+        "objective_value": solver.ObjectiveValue() if has_solution else None,
+        "wall_time": solver.WallTime(),
+    }
+
+
+def run_portfolio(num_planes, num_runways, planes_data, separation_times, strategies=None, time_limit=None, hint=False, max_workers=None):
+    """
+    Solves the CP model once per search strategy in parallel processes.
+
+    Each process runs a single CP-SAT worker so the portfolio does not oversubscribe the cores.
+
+    Args:
+        num_planes (int): The number of planes.
+        num_runways (int): The number of runways.
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        strategies (list): The search_branching values to try, PORTFOLIO_STRATEGIES by default.
+        time_limit (float): The time limit of each run in seconds.
+        hint (bool): Whether to hint the greedy schedule.
+        max_workers (int): The number of processes, one per strategy by default.
+
+    Returns:
+        list: One result dictionary per strategy, the best objective value first.
+    """
+    strategies = PORTFOLIO_STRATEGIES if strategies is None else strategies
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(strategies)) as executor:
+        futures = [
+            executor.submit(
+                _solve_with_strategy, num_planes, num_runways, planes_data,
+                separation_times, strategy, time_limit, hint
+            )
+            for strategy in strategies
+        ]
+        results = [future.result() for future in futures]
+
+    results.sort(
+        key=lambda r: (r["objective_value"] is None, r["objective_value"] or 0, r["wall_time"])
+    )
+
+    print("\n" + "=" * 60)
+    print("\t\t     Portfolio results")
+    print("=" * 60, "\n")
+    for r in results:
+        print(f"-> Strategy {r['search_strategy']}: {r['status']} | Cost: {r['objective_value']} | Time: {r['wall_time']:.2f}s")
+
+    return results
+
+
+# ----------------------------
+# DECOMPOSITION
+# ----------------------------
+
+def _solve_runway_group(group, planes_data, separation_times, time_limit, hint):
+    """Solves the single-runway subproblem of one runway in a worker process."""
+    sub_planes = [planes_data[i] for i in group]
+    separation_times = separation_rows(separation_times)
+    sub_separation = [[separation_times[i][j] for j in group] for i in group]
+
+    solver, _, vars_ = solve_single_runway_cp(
+        len(group), sub_planes, sub_separation, hint=hint,
+        num_workers=1, time_limit=time_limit
+    )
+
+    status = solver.StatusName()
+    has_solution = status in ("OPTIMAL", "FEASIBLE")
+    return {
+        "planes": group,
+        "status": status,
+        "objective_value": solver.ObjectiveValue() if has_solution else None,
+        "landing_times": solution_values(solver, vars_["landing_time"]) if has_solution else None,
+    }
+
+
+def solve_multiple_runways_decompose(num_planes, num_runways, planes_data, separation_times, time_limit=None, hint=True, max_workers=None):
+    """
+    Heuristic for multiple runways: fixes the runway of each plane and solves every runway
+    as an independent single-runway CP model, in parallel processes.
+
+    The runways come from the greedy schedule, so the result is a feasible schedule for the
+    full problem (when every runway is feasible) but not necessarily an optimal one.
+
+    Args:
+        num_planes (int): The number of planes.
+        num_runways (int): The number of runways.
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        time_limit (float): The time limit of each runway in seconds.
+        hint (bool): Whether to hint the greedy schedule to each runway.
+        max_workers (int): The number of processes, one per runway by default.
+
+    Returns:
+        dict: A dictionary containing:
+            - status (str): FEASIBLE if every runway was solved, else the first failing status.
+            - objective_value (float): The total cost, or None.
+            - landing_times (list): The landing time of each plane, or None.
+            - runways (list): The runway of each plane.
+    """
+    _, runways = greedy_schedule(planes_data, separation_times, num_runways)
+    groups = [
+        [i for i in range(num_planes) if runways[i] == r] for r in range(num_runways)
+    ]
+    groups = [group for group in groups if group]
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(groups)) as executor:
+        futures = [
+            executor.submit(
+                _solve_runway_group, group, planes_data, separation_times, time_limit, hint
+            )
+            for group in groups
+        ]
+        results = [future.result() for future in futures]
+
+    failed = [r["status"] for r in results if r["objective_value"] is None]
+    landing_times = None
+    objective_value = None
+    if not failed:
+        landing_times = [0] * num_planes
+        for r in results:
+            for i, t in zip(r["planes"], r["landing_times"]):
+                landing_times[i] = t
+        objective_value = sum(r["objective_value"] for r in results)
+
+    print("\n" + "=" * 60)
+    print("\t\t   Decomposition results")
+    print("=" * 60, "\n")
+    print("\n".join(
+        f"-> Runway {runways[r['planes'][0]]}: {len(r['planes'])} planes | {r['status']} | Cost: {r['objective_value']}"
+        for r in results
+    ))
+    print("-> Total cost:", objective_value)
+
+    return {
+        "status": failed[0] if failed else "FEASIBLE",
+        "objective_value": objective_value,
+        "landing_times": landing_times,
+        "runways": runways,
+    }
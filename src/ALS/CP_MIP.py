@@ -1,49 +1,178 @@
+from ortools.sat import sat_parameters_pb2
 from ortools.sat.python import cp_model
 
+from .utils import (
+    DEFAULT_NUM_WORKERS,
+    add_precedences,
+    classify_pairs,
+    extract_plane_arrays,
+    greedy_schedule,
+    min_separations,
+    pair_coefficients,
+    separation_rows,
+    solution_value_lists,
+)
+
+def add_greedy_hint(model, variables, planes_data, separation_times, num_runways=1):
+    """
+    Hints the first-come-first-served schedule to the CP-SAT model, with the deviations,
+    landing orders and runway assignments it implies.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        variables (dict): A dictionary containing the decision variables.
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        num_runways (int): The number of runways.
+    """
+    landing_times, runways = greedy_schedule(planes_data, separation_times, num_runways)
+
+    # Runways are numbered in order of first use, to match the symmetry breaking
+    labels = {}
+    for r in runways:
+        labels.setdefault(r, len(labels))
+    runways = [labels[r] for r in runways]
+
+    for i, p in enumerate(planes_data):
+        target_i = p["target_landing_time"]
+        model.AddHint(variables["landing_time"][i], landing_times[i])
+        model.AddHint(variables["early_deviation"][i], max(target_i - landing_times[i], 0))
+        model.AddHint(variables["late_deviation"][i], max(landing_times[i] - target_i, 0))
+
+    for (i, j), literal in variables["landing_order"].items():
+        model.AddHint(literal, (landing_times[i], i) < (landing_times[j], j))
+
+    if "landing_runway" in variables:
+        for (i, r), literal in variables["landing_runway"].items():
+            model.AddHint(literal, runways[i] == r)
+        for (i, j), literal in variables["same_runway"].items():
+            model.AddHint(literal, runways[i] == runways[j])
+
+
+def _als_default_params(num_workers=None):
+    """
+    Builds the CP-SAT parameters tuned for the landing problem.
+
+    Core-guided optimization suits the weighted deviation objective, and the runway
+    symmetry is left to the solver on top of the value-precedence constraints.
+
+    Args:
+        num_workers (int): The number of search workers, or None for the default.
+
+    Returns:
+        sat_parameters_pb2.SatParameters: The default parameters.
+    """
+    params = sat_parameters_pb2.SatParameters()
+    params.num_search_workers = num_workers or DEFAULT_NUM_WORKERS
+    params.optimize_with_core = True
+    params.symmetry_level = 2
+    return params
+
+
+def _configure_solver(num_workers, log, linearization_level, repair_hint, params=None):
+    """
+    Creates a CP-SAT solver with the parameters shared by the solve functions.
+
+    Args:
+        num_workers (int): The number of search workers, ignored when params is given.
+        log (bool): Whether to print the CP-SAT search log.
+        linearization_level (int): How much of the model goes into the LP relaxation
+            (0 to 2), or None to keep the value from params.
+        repair_hint (bool): Whether to repair an infeasible solution hint.
+        params (sat_parameters_pb2.SatParameters): The base parameters, or None for
+            _als_default_params().
+
+    Returns:
+        cp_model.CpSolver: The configured solver.
+    """
+    solver = cp_model.CpSolver()
+    solver.parameters.CopyFrom(
+        params if params is not None else _als_default_params(num_workers)
+    )
+    solver.parameters.log_search_progress = log
+    if linearization_level is not None:
+        solver.parameters.linearization_level = linearization_level
+    solver.parameters.repair_hint = repair_hint
+    return solver
+
+
+def _add_transitivity(model, landing_order):
+    """
+    Forbids landing-order cycles on every triple of planes whose three pairs are undecided.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        landing_order (dict): The delta_ij literals, keyed by (i, j) with i < j.
+    """
+    successors = {}
+    for i, j in landing_order:
+        successors.setdefault(i, []).append(j)
+
+    for (i, j), delta_ij in landing_order.items():
+        for k in successors.get(j, ()):
+            delta_ik = landing_order.get((i, k))
+            if delta_ik is None:
+                continue
+            delta_jk = landing_order[(j, k)]
+            # i before j before k implies i before k, and k before j before i
+            # implies k before i
+            model.AddBoolOr([delta_ij.Not(), delta_jk.Not(), delta_ik])
+            model.AddBoolOr([delta_ij, delta_jk, delta_ik.Not()])
+
+
+def _create_plane_variables(model, variables, earliest, target, latest, uncertain_pairs, debug_names=False):
+    """
+    Creates the landing time, landing order and deviation variables shared by both models.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        variables (dict): The dictionary the decision variables are stored in.
+        earliest (list): The earliest landing time of each plane.
+        target (list): The target landing time of each plane.
+        latest (list): The latest landing time of each plane.
+        uncertain_pairs (list): The (i, j) pairs of Set U.
+        debug_names (bool): Whether to name the variables, only useful when inspecting
+            the model proto or the solver log.
+
+    Returns:
+        tuple: A tuple containing:
+            - landing_times (list): The x_i variables.
+            - landing_order (dict): The delta_ij literals, keyed by (i, j) with i < j.
+            - early_deviation (list): The alpha_i variables.
+            - late_deviation (list): The beta_i variables.
+    """
+    num_planes = len(earliest)
 
-def create_cp_model_multiple_runways(
-    num_planes,
-    planes_data,
-    separation_times,
-    num_runways,
-):
-    print("=" * 60)
-    print("\t\t    Creating CP-SAT Model")
-    print("=" * 60, "\n")
-
-    model = cp_model.CpModel()
-    variables = {}
-
-    # Decision Variables
     # x_i: Landing time for plane i
     landing_times = [
         model.NewIntVar(
-            planes_data[i]["earliest_landing_time"],
-            planes_data[i]["latest_landing_time"],
-            f"LandingTime_{i}",
+            earliest[i],
+            latest[i],
+            f"LandingTime_{i}" if debug_names else "",
         )
         for i in range(num_planes)
     ]
     variables["landing_time"] = landing_times
 
     # delta_ij:  Binary variable representing if plane i lands before plane j
+    # Only delta_ij with i < j is created, delta_ji is its negation (2), and only
+    # for the pairs of Set U: the order of W and V pairs is fixed by (6)
     landing_order = {}
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                landing_order[(i, j)] = model.NewBoolVar(f"LandingOrder_{i}_{j}")
+    for i, j in uncertain_pairs:
+        if i < j:
+            landing_order[(i, j)] = model.NewBoolVar(f"LandingOrder_{i}_{j}" if debug_names else "")
     variables["landing_order"] = landing_order
 
+    # Largest possible deviations, the upper bounds of (15) and (17)
+    ub_early = [max(t - e, 0) for t, e in zip(target, earliest)]
+    ub_late = [max(l - t, 0) for l, t in zip(latest, target)]
+
     # alpha_i: Time by which plane i lands before its target time
     early_deviation = [
         model.NewIntVar(
             0,
-            max(
-                planes_data[i]["target_landing_time"]
-                - planes_data[i]["earliest_landing_time"],
-                0,
-            ),
-            f"EarlyDeviation_{i}",
+            ub_early[i],
+            f"EarlyDeviation_{i}" if debug_names else "",
         )
         for i in range(num_planes)
     ]
@@ -53,447 +182,442 @@ def create_cp_model_multiple_runways(
     late_deviation = [
         model.NewIntVar(
             0,
-            max(
-                planes_data[i]["latest_landing_time"]
-                - planes_data[i]["target_landing_time"],
-                0,
-            ),
-            f"LateDeviation_{i}",
+            ub_late[i],
+            f"LateDeviation_{i}" if debug_names else "",
         )
         for i in range(num_planes)
     ]
     variables["late_deviation"] = late_deviation
 
+    return landing_times, landing_order, early_deviation, late_deviation
+
+
+def _add_deviation_constraints(model, landing_times, early_deviation, late_deviation, target):
+    """
+    Relates the deviation variables to the landing times.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        landing_times (list): The x_i variables.
+        early_deviation (list): The alpha_i variables.
+        late_deviation (list): The beta_i variables.
+        target (list): The target landing time of each plane.
+    """
+    for x_i, alpha_i, beta_i, target_i in zip(
+        landing_times, early_deviation, late_deviation, target
+    ):
+        # (14)-(17): alpha_i = max(T_i - x_i, 0) and beta_i = max(x_i - T_i, 0),
+        # which also implies (18) x_i = T_i - alpha_i + beta_i
+        model.AddMaxEquality(alpha_i, [target_i - x_i, 0])
+        model.AddMaxEquality(beta_i, [x_i - target_i, 0])
+
+
+def _add_objective(model, early_deviation, late_deviation, penalty_early, penalty_late):
+    """
+    Sets the total penalty objective and reports the size of the model.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        early_deviation (list): The alpha_i variables.
+        late_deviation (list): The beta_i variables.
+        penalty_early (list): The penalty per time unit before the target of each plane.
+        penalty_late (list): The penalty per time unit after the target of each plane.
+    """
+    # Objective: Minimize total penalties
+    model.Minimize(
+        cp_model.LinearExpr.WeightedSum(
+            early_deviation + late_deviation,
+            penalty_early + penalty_late,
+        )
+    )
+
+    # Display the number of variables and constraints
+    proto = model.Proto()
+    print("-> Number of decision variables created:", len(proto.variables))
+    print("-> Number of constraints:", len(proto.constraints))
+
+
+def _print_solution(solver, status, num_planes, planes_data, variables):
+    """
+    Prints the cost of the solution and the planes that missed their target time.
+
+    Args:
+        solver (cp_model.CpSolver): The CP-SAT solver after the solve.
+        status (int): The status returned by the solve.
+        num_planes (int): The number of planes.
+        planes_data (list): A list of dictionaries containing plane data.
+        variables (dict): A dictionary containing the decision variables.
+    """
+    landing_time = variables["landing_time"]
+    early_deviation = variables["early_deviation"]
+    late_deviation = variables["late_deviation"]
+
+    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+        if status == cp_model.OPTIMAL:
+            print(f"-> Optimal Cost: {solver.ObjectiveValue()}")
+        else:
+            print("-> Best feasible solution found.")
+
+        early_values, late_values, landing_values = solution_value_lists(
+            solver, early_deviation, late_deviation, landing_time
+        )
+        lines = ["\n-> Planes that did not land on the target time:"]
+        for i in range(num_planes):
+            e_ = early_values[i]
+            L_ = late_values[i]
+            # If early_deviation or late_deviation > 0, plane missed its target
+            if e_ > 0 or L_ > 0:
+                # Calculate penalty
+                penalty = (
+                    e_ * planes_data[i]["penalty_early"]
+                    + L_ * planes_data[i]["penalty_late"]
+                )
+                landing_t = landing_values[i]
+                target_t = planes_data[i]["target_landing_time"]
+                lines.append(
+                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
+                )
+        print("\n".join(lines))
+    else:
+        print(
+            "-> No feasible/optimal solution found. Status:", solver.StatusName(status)
+        )
+
+
+def create_cp_model_multiple_runways(
+    num_planes,
+    planes_data,
+    separation_times,
+    num_runways,
+    add_transitivity=False,
+    debug_names=False,
+):
+    # With a single runway every z_ij and y_i0 is fixed to 1, so the single-runway
+    # model is the same problem without the runway variables and constraints
+    if num_runways == 1:
+        return create_cp_model_single_runway(
+            num_planes, planes_data, separation_times, add_transitivity, debug_names
+        )
+
+    print("=" * 60)
+    print("\t\t    Creating CP-SAT Model")
+    print("=" * 60, "\n")
+
+    separation_times = separation_rows(separation_times)
+
+    model = cp_model.CpModel()
+    variables = {}
+
+    earliest, target, latest, penalty_early, penalty_late = extract_plane_arrays(
+        planes_data
+    )
+
+    # Set W (3), Set V (4) and Set U (5)
+    (
+        _,
+        certain_with_no_separation_pairs,
+        uncertain_pairs,
+    ) = classify_pairs(
+        earliest,
+        latest,
+        separation_times,
+    )
+
+    # Decision Variables
+    (
+        landing_times,
+        landing_order,
+        early_deviation,
+        late_deviation,
+    ) = _create_plane_variables(
+        model, variables, earliest, target, latest, uncertain_pairs, debug_names
+    )
+
+    def lo(i, j):
+        return landing_order[(i, j)] if i < j else landing_order[(j, i)].Not()
+
     # z_ij:  Binary variable indicating if plane i and plane j land on the same runway
+    # Only z_ij with i < j is created, since z_ij = z_ji (29)
     same_runway = {}
     for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                same_runway[(i, j)] = model.NewBoolVar(f"SameRunway_{i}_{j}")
+        for j in range(i + 1, num_planes):
+            same_runway[(i, j)] = model.NewBoolVar(f"SameRunway_{i}_{j}" if debug_names else "")
 
     variables["same_runway"] = same_runway
 
+    def sr(i, j):
+        return same_runway[(i, j)] if i < j else same_runway[(j, i)]
+
     # y_ir:  Binary variable indicating if plane i lands on runway r
     landing_runway = {}
     for i in range(num_planes):
         for r in range(num_runways):
-            landing_runway[(i, r)] = model.NewBoolVar(f"LandingRunway_{i}_{r}")
+            landing_runway[(i, r)] = model.NewBoolVar(f"LandingRunway_{i}_{r}" if debug_names else "")
 
     variables["landing_runway"] = landing_runway
 
-    # Constraints
-    # (2) Each pair of planes must have an order
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            model.Add(landing_order[(i, j)] + landing_order[(j, i)] == 1)
-
-    # Set W: Pairs with certain separation
-    certain_with_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij <= earliest_j:
-                    certain_with_separation_pairs.append((i, j))
-
-    # Set V: Pairs with certain order but separation not automatic
-    certain_with_no_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij > earliest_j:
-                    certain_with_no_separation_pairs.append((i, j))
-
-    # Set U: Uncertain pairs
-    uncertain_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i = planes_data[i]["earliest_landing_time"]
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                latest_j = planes_data[j]["latest_landing_time"]
-
-                if (
-                    (earliest_j <= earliest_i <= latest_j)
-                    or (earliest_j <= latest_i <= latest_j)
-                ) or (
-                    (earliest_i <= earliest_j <= latest_i)
-                    or (earliest_i <= latest_j <= latest_i)
-                ):
-                    uncertain_pairs.append((i, j))
+    # The y_ir of each plane, in runway order, to avoid dict lookups in the loops below
+    y_by_plane = [
+        [landing_runway[(i, r)] for r in range(num_runways)] for i in range(num_planes)
+    ]
 
+    # Constraints
     # Enforce separation for pairs where order is determined (Set V)
-    for i, j in certain_with_no_separation_pairs:
-        model.Add(landing_order[(i, j)] == 1)  # (6)
-        model.Add(
-            landing_times[j]
-            >= landing_times[i] + separation_times[i][j] * same_runway[(i, j)]
-        )  # (7)
+    # (6) holds by construction, no landing_order variable exists for Sets W and V
+    separations, _ = pair_coefficients(
+        certain_with_no_separation_pairs, earliest, latest, separation_times
+    )
+    # The separation rows are O(n^2), so they are appended to the proto directly as
+    # (before, after, separation, enforcement literals) precedences
+    precedences = []
+    add_precedence = precedences.append
 
-    # Enforce order for pairs where order is determined and separation is automatic (Set W)
-    for i, j in certain_with_separation_pairs:
-        model.Add(landing_order[(i, j)] == 1)  # (6)
+    # (7): on a V pair x_j >= x_i holds by the windows, so x_j >= x_i + S_ij * z_ij is
+    # the separation enforced by z_ij
+    for (i, j), separation_ij in zip(certain_with_no_separation_pairs, separations):
+        add_precedence((landing_times[i], landing_times[j], separation_ij, (sr(i, j),)))
 
     # Enforce separation for uncertain pairs
-    for i, j in uncertain_pairs:
-        # solver.Add(landing_times[j] >= landing_times[i] + separation_times[i][j] * same_runway[(i, j)] + separation_times_between_runways[(i, j)] * (1 - same_runway[(i, j)]) - M * (landing_order[(j, i)])) # (8)
-        latest_i = planes_data[i]["latest_landing_time"]
-        earliest_j = planes_data[j]["earliest_landing_time"]
+    separations, _ = pair_coefficients(
+        uncertain_pairs, earliest, latest, separation_times
+    )
+    for (i, j), separation_ij in zip(uncertain_pairs, separations):
+        # (8), x_j >= x_i + S_ij * z_ij - (L_i + S_ij - E_j) * delta_ji: the big-M term
+        # only relaxes the row when j lands first, so it is the separation enforced by
+        # delta_ij and z_ij, plus the order x_j >= x_i enforced by delta_ij alone
+        delta_ij = lo(i, j)
+        add_precedence(
+            (landing_times[i], landing_times[j], separation_ij, (delta_ij, sr(i, j)))
+        )
+        add_precedence((landing_times[i], landing_times[j], 0, (delta_ij,)))
+    add_precedences(model, precedences)
+
+    # Redundant disjunctive constraint per runway (see min_separations)
+    min_separation = min_separations(separation_times)
+    for r in range(num_runways):
+        model.AddNoOverlap(
+            model.NewOptionalFixedSizeIntervalVar(
+                landing_times[i],
+                min_separation[i],
+                y_by_plane[i][r],
+                f"RunwayInterval_{i}_{r}" if debug_names else "",
+            )
+            for i in range(num_planes)
+        )
 
-        model.Add(
-            landing_times[j]
-            >= landing_times[i]
-            + separation_times[i][j] * same_runway[(i, j)]
-            - (latest_i + separation_times[i][j] - earliest_j) * (landing_order[(j, i)])
-        )  # (8)
+    # Transitivity cuts on the landing order, O(|U|^3 / n^3) triples so off by default
+    if add_transitivity:
+        _add_transitivity(model, landing_order)
 
     # Relating Deviation Variables to Landing Times
-    for i in range(num_planes):
-        earliest_i = planes_data[i]["earliest_landing_time"]
-        latest_i = planes_data[i]["latest_landing_time"]
-        target_i = planes_data[i]["target_landing_time"]
-
-        # (14)
-        model.Add(early_deviation[i] >= target_i - landing_times[i])
-
-        # (15)
-        model.Add(early_deviation[i] >= 0)
-        model.Add(early_deviation[i] <= target_i - earliest_i)
-
-        # (16)
-        model.Add(late_deviation[i] >= landing_times[i] - target_i)
-
-        # (17)
-        model.Add(late_deviation[i] >= 0)
-        model.Add(late_deviation[i] <= latest_i - target_i)
-
-        # (18)
-        model.Add(
-            landing_times[i] == target_i - early_deviation[i] + late_deviation[i]
-        )
+    _add_deviation_constraints(model, landing_times, early_deviation, late_deviation, target)
 
     # New constraints for multiple runways
     # (28) Each plane must land on exactly one runway
     for i in range(num_planes):
-        model.Add(
-            sum(landing_runway[(i, r)] for r in range(num_runways)) == 1
-        )
+        model.AddExactlyOne(y_by_plane[i])
 
-    # (29) same_runway is symmetric
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            model.Add(same_runway[(i, j)] == same_runway[(j, i)])
+    # Symmetry breaking: the runways are identical, so they are numbered in order of
+    # first use by the planes (value precedence) and plane i lands on a runway r <= i
+    for i in range(min(num_planes, num_runways)):
+        for r in range(i + 1, num_runways):
+            model.Add(y_by_plane[i][r] == 0)
 
-    # (30) same_runway is true if both planes are assigned to the same runway
+    # (30) same_runway is true if both planes are assigned to the same runway:
+    # z_ij >= y_ir + y_jr - 1 is the clause (not y_ir or not y_jr or z_ij). The clause
+    # (not y_ir or y_jr or not z_ij) also makes z_ij false on different runways.
     for i in range(num_planes):
         for j in range(i + 1, num_planes):
-            for r in range(num_runways):
-                model.Add(
-                    same_runway[(i, j)]
-                    >= landing_runway[(i, r)] + landing_runway[(j, r)] - 1
-                )
+            z_ij = same_runway[(i, j)]
+            for y_ir, y_jr in zip(y_by_plane[i], y_by_plane[j]):
+                model.AddBoolOr([y_ir.Not(), y_jr.Not(), z_ij])
+                model.AddBoolOr([y_ir.Not(), y_jr, z_ij.Not()])
 
-    # Objective: Minimize total penalties
-    objective_terms = []
-    for i in range(num_planes):
-        objective_terms.append(
-            planes_data[i]["penalty_early"] * early_deviation[i]
-        )
-        objective_terms.append(
-            planes_data[i]["penalty_late"] * late_deviation[i]
-        )
-
-    model.Minimize(sum(objective_terms))
-
-    # Display the number of variables and constraints
-    print("-> Number of decision variables created:", model.Proto().variables.__len__())
-    print("-> Number of constraints:", model.Proto().constraints.__len__())
+    _add_objective(model, early_deviation, late_deviation, penalty_early, penalty_late)
 
     return model, variables
 
 
-def solve_cp_sat_model_multiple_runways(num_planes, num_runways, planes_data, separation_times, hint=False):
+def solve_cp_sat_model_multiple_runways(num_planes, num_runways, planes_data, separation_times, hint=False, num_workers=None, log=False, linearization_level=None, add_transitivity=False, params=None, debug_names=False):
+    """Builds and solves the multiple-runway model, with params (SatParameters) defaulting to _als_default_params()."""
     model, variables = create_cp_model_multiple_runways(
-        num_planes, planes_data, separation_times, num_runways
+        num_planes, planes_data, separation_times, num_runways, add_transitivity,
+        debug_names,
     )
 
     if hint:
-        for i in range(num_planes):
-            model.AddHint(variables["landing_time"][i], planes_data[i]["target_landing_time"])
+        add_greedy_hint(model, variables, planes_data, separation_times, num_runways)
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving CP-SAT Model")
     print("=" * 60, "\n")
 
     # Create solver and solve
-    solver = cp_model.CpSolver()
+    solver = _configure_solver(
+        num_workers, log, linearization_level, repair_hint=hint, params=params
+    )
     status = solver.Solve(model)
 
-    landing_time = variables["landing_time"]
-    early_deviation = variables["early_deviation"]
-    late_deviation = variables["late_deviation"]
-
-    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-        if status == cp_model.OPTIMAL:
-            print(f"-> Optimal Cost: {solver.ObjectiveValue()}")
-        else:
-            print("-> Best feasible solution found.")
-
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
-    else:
-        print(
-            "-> No feasible/optimal solution found. Status:", solver.StatusName(status)
-        )
+    _print_solution(solver, status, num_planes, planes_data, variables)
 
     # Optionally, you can return the solver for further inspection
     return solver, model
 
 
-from ortools.sat.python import cp_model
+def _tighten_windows(earliest, latest, pairs, separations):
+    """
+    Tightens the landing windows along the pairs of Set V on a single runway, where
+    x_j >= x_i + S_ij gives x_j >= E_i + S_ij and x_i <= L_j - S_ij.
+
+    Args:
+        earliest (list): The earliest landing time of each plane.
+        latest (list): The latest landing time of each plane.
+        pairs (list): The (i, j) pairs of Set V.
+        separations (list): S_ij for each pair.
 
+    Returns:
+        tuple: A tuple containing two lists:
+            - lower: the tightened lower bound of each landing time.
+            - upper: the tightened upper bound of each landing time.
+    """
+    lower = list(earliest)
+    upper = list(latest)
+    ordered = list(zip(pairs, separations))
 
-def create_cp_model_single_runway(num_planes, planes_data, separation_times):
+    # In Set V, L_i < E_j, so sorting by E_i visits (i, j) before any (j, k) and the
+    # bounds propagate along whole chains of pairs in one pass (and back by L_j)
+    for (i, j), separation_ij in sorted(ordered, key=lambda item: earliest[item[0][0]]):
+        lower[j] = max(lower[j], lower[i] + separation_ij)
+    for (i, j), separation_ij in sorted(
+        ordered, key=lambda item: latest[item[0][1]], reverse=True
+    ):
+        upper[i] = min(upper[i], upper[j] - separation_ij)
+
+    return lower, upper
+
+
+def create_cp_model_single_runway(num_planes, planes_data, separation_times, add_transitivity=False, debug_names=False):
     print("=" * 60)
     print("\t\t    Creating CP-SAT Model")
     print("=" * 60, "\n")
 
+    separation_times = separation_rows(separation_times)
+
     model = cp_model.CpModel()
     variables = {}
 
-    # Decision Variables
-    # x_i: Landing time for plane i
-    landing_times = [
-        model.NewIntVar(
-            planes_data[i]["earliest_landing_time"],
-            planes_data[i]["latest_landing_time"],
-            f"LandingTime_{i}",
-        )
-        for i in range(num_planes)
-    ]
-    variables["landing_time"] = landing_times
+    earliest, target, latest, penalty_early, penalty_late = extract_plane_arrays(
+        planes_data
+    )
 
-    # delta_ij:  Binary variable representing if plane i lands before plane j
-    landing_order = {}
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                landing_order[(i, j)] = model.NewBoolVar(f"LandingOrder_{i}_{j}")
-    variables["landing_order"] = landing_order
+    # Set W (3), Set V (4) and Set U (5)
+    (
+        _,
+        certain_with_no_separation_pairs,
+        uncertain_pairs,
+    ) = classify_pairs(
+        earliest,
+        latest,
+        separation_times,
+    )
 
-    # alpha_i: Time by which plane i lands before its target time
-    early_deviation = [
-        model.NewIntVar(
-            0,
-            max(
-                planes_data[i]["target_landing_time"]
-                - planes_data[i]["earliest_landing_time"],
-                0,
-            ),
-            f"EarlyDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
-    variables["early_deviation"] = early_deviation
+    certain_separations, _ = pair_coefficients(
+        certain_with_no_separation_pairs, earliest, latest, separation_times
+    )
 
-    # beta_i: Time by which plane i lands after its target time
-    late_deviation = [
-        model.NewIntVar(
-            0,
-            max(
-                planes_data[i]["latest_landing_time"]
-                - planes_data[i]["target_landing_time"],
-                0,
-            ),
-            f"LateDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
-    variables["late_deviation"] = late_deviation
+    # On a single runway the fixed orders of Set V shrink the landing windows, which
+    # gives CP-SAT tighter root domains (the big-M of (11) still uses the raw windows)
+    lower, upper = _tighten_windows(
+        earliest, latest, certain_with_no_separation_pairs, certain_separations
+    )
 
-    # Constraints
-    # (2) Each pair of planes must have an order
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            model.Add(landing_order[(i, j)] + landing_order[(j, i)] == 1)
+    # The propagation can empty a window when the instance is infeasible. A variable
+    # with lower > upper makes the model invalid, so the raw windows are kept and an
+    # empty clause makes the model infeasible instead.
+    if any(lower[i] > upper[i] for i in range(num_planes)):
+        print("-> A landing window is empty after propagation, the model is infeasible\n")
+        lower, upper = earliest, latest
+        model.AddBoolOr([])
 
-    # Set V: Pairs with certain order but separation not automatic
-    certain_with_no_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij > earliest_j:
-                    certain_with_no_separation_pairs.append((i, j))
-
-    # Set W: Pairs with certain separation
-    certain_with_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij <= earliest_j:
-                    certain_with_separation_pairs.append((i, j))
-
-    # Set U: Uncertain pairs
-    uncertain_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i = planes_data[i]["earliest_landing_time"]
-                latest_i = planes_data[i]["latest_landing_time"]
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                latest_j = planes_data[j]["latest_landing_time"]
-
-                if (
-                    (earliest_j <= earliest_i <= latest_j)
-                    or (earliest_j <= latest_i <= latest_j)
-                ) or (
-                    (earliest_i <= earliest_j <= latest_i)
-                    or (earliest_i <= latest_j <= latest_i)
-                ):
-                    uncertain_pairs.append((i, j))
+    # Decision Variables
+    (
+        landing_times,
+        landing_order,
+        early_deviation,
+        late_deviation,
+    ) = _create_plane_variables(
+        model, variables, lower, target, upper, uncertain_pairs, debug_names
+    )
 
-    # Enforce separation for pairs where order is determined (Set V)
-    for i, j in certain_with_no_separation_pairs:
-        model.Add(landing_order[(i, j)] == 1)
-        model.Add(landing_times[j] >= landing_times[i] + separation_times[i][j])
+    def lo(i, j):
+        return landing_order[(i, j)] if i < j else landing_order[(j, i)].Not()
 
-    # Enforce order for pairs where order is determined and separation is automatic (Set W)
-    for i, j in certain_with_separation_pairs:
-        model.Add(landing_order[(i, j)] == 1)
+    # Constraints
+    # Enforce separation for pairs where order is determined (Set V)
+    # (6) holds by construction, no landing_order variable exists for Sets W and V
+    # The separation rows are O(n^2), so they are appended to the proto directly as
+    # (before, after, separation, enforcement literals) precedences
+    precedences = []
+    add_precedence = precedences.append
+    for (i, j), separation_ij in zip(
+        certain_with_no_separation_pairs, certain_separations
+    ):
+        add_precedence((landing_times[i], landing_times[j], separation_ij, ()))
 
     # Enforce separation for uncertain pairs
-    for i, j in uncertain_pairs:
-        latest_i = planes_data[i]["latest_landing_time"]
-        earliest_j = planes_data[j]["earliest_landing_time"]
-        separation_ij = separation_times[i][j]
-        delta_ij = landing_order[(i, j)]
-        delta_ji = landing_order[(j, i)]
-
-        # Constraint (11)
-        model.Add(
-            landing_times[j]
-            >= landing_times[i]
-            + separation_ij * delta_ij
-            - (latest_i - earliest_j) * delta_ji
-        )
-
-    # Relating Deviation Variables to Landing Times
-    for i in range(num_planes):
-        earliest_i = planes_data[i]["earliest_landing_time"]
-        latest_i = planes_data[i]["latest_landing_time"]
-        target_i = planes_data[i]["target_landing_time"]
-
-        # (14)
-        model.Add(early_deviation[i] >= target_i - landing_times[i])
-
-        # (15)
-        model.Add(early_deviation[i] >= 0)
-        model.Add(early_deviation[i] <= target_i - earliest_i)
-
-        # (16)
-        model.Add(late_deviation[i] >= landing_times[i] - target_i)
-
-        # (17)
-        model.Add(late_deviation[i] >= 0)
-        model.Add(late_deviation[i] <= latest_i - target_i)
-
-        # (18)
-        model.Add(
-            landing_times[i] == target_i - early_deviation[i] + late_deviation[i]
+    separations, _ = pair_coefficients(
+        uncertain_pairs, earliest, latest, separation_times
+    )
+    for (i, j), separation_ij in zip(uncertain_pairs, separations):
+        # Constraint (11), x_j >= x_i + S_ij * delta_ij - (L_i - E_j) * delta_ji: when j
+        # lands first the row holds by the windows, so it is the separation enforced
+        # by delta_ij
+        add_precedence((landing_times[i], landing_times[j], separation_ij, (lo(i, j),)))
+    add_precedences(model, precedences)
+
+    # Redundant disjunctive constraint (see min_separations)
+    min_separation = min_separations(separation_times)
+    model.AddNoOverlap(
+        model.NewFixedSizeIntervalVar(
+            landing_times[i],
+            min_separation[i],
+            f"LandingInterval_{i}" if debug_names else "",
         )
+        for i in range(num_planes)
+    )
 
-    # Objective: Minimize total penalties
-    objective_terms = []
-    for i in range(num_planes):
-        objective_terms.append(
-            planes_data[i]["penalty_early"] * early_deviation[i]
-        )
-        objective_terms.append(
-            planes_data[i]["penalty_late"] * late_deviation[i]
-        )
+    # Transitivity cuts on the landing order, O(|U|^3 / n^3) triples so off by default
+    if add_transitivity:
+        _add_transitivity(model, landing_order)
 
-    model.Minimize(sum(objective_terms))
+    # Relating Deviation Variables to Landing Times
+    _add_deviation_constraints(model, landing_times, early_deviation, late_deviation, target)
 
-    # Display the number of variables and constraints
-    print("-> Number of decision variables created:", len(model.Proto().variables))
-    print("-> Number of constraints:", len(model.Proto().constraints))
+    _add_objective(model, early_deviation, late_deviation, penalty_early, penalty_late)
 
     return model, variables
 
 
-def solve_cp_sat_model_single_runway(num_planes, planes_data, separation_times, hint=False):
+def solve_cp_sat_model_single_runway(num_planes, planes_data, separation_times, hint=False, num_workers=None, log=False, linearization_level=None, add_transitivity=False, params=None, debug_names=False):
+    """Builds and solves the single-runway model, with params (SatParameters) defaulting to _als_default_params()."""
     model, variables = create_cp_model_single_runway(
-        num_planes, planes_data, separation_times
+        num_planes, planes_data, separation_times, add_transitivity, debug_names
     )
 
     if hint:
-        for i in range(num_planes):
-            model.AddHint(variables["landing_time"][i], planes_data[i]["target_landing_time"])
+        add_greedy_hint(model, variables, planes_data, separation_times)
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving CP-SAT Model")
     print("=" * 60, "\n")
 
     # Create solver and solve
-    solver = cp_model.CpSolver()
+    solver = _configure_solver(
+        num_workers, log, linearization_level, repair_hint=hint, params=params
+    )
     status = solver.Solve(model)
 
-    landing_time = variables["landing_time"]
-    early_deviation = variables["early_deviation"]
-    late_deviation = variables["late_deviation"]
-
-    if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-        if status == cp_model.OPTIMAL:
-            print(f"-> Optimal Cost: {solver.ObjectiveValue()}")
-        else:
-            print("-> Best feasible solution found.")
-
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
-    else:
-        print(
-            "-> No feasible/optimal solution found. Status:", solver.StatusName(status)
-        )
+    _print_solution(solver, status, num_planes, planes_data, variables)
 
     # Optionally, you can return the solver for further inspection
     return solver, model, variables
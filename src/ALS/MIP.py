@@ -1,5 +1,152 @@
 from ortools.linear_solver import pywraplp
-import psutil
+
+from .utils import (
+    DEFAULT_NUM_WORKERS,
+    classify_pairs,
+    extract_plane_arrays,
+    greedy_schedule,
+    pair_coefficients,
+    separation_rows,
+)
+
+# pywraplp has no StatusName, so the result statuses are named here
+_STATUS_NAMES = {
+    pywraplp.Solver.OPTIMAL: "OPTIMAL",
+    pywraplp.Solver.FEASIBLE: "FEASIBLE",
+    pywraplp.Solver.INFEASIBLE: "INFEASIBLE",
+    pywraplp.Solver.UNBOUNDED: "UNBOUNDED",
+    pywraplp.Solver.ABNORMAL: "ABNORMAL",
+    pywraplp.Solver.MODEL_INVALID: "MODEL_INVALID",
+    pywraplp.Solver.NOT_SOLVED: "NOT_SOLVED",
+}
+
+
+def _num_var_array(solver, lower_bounds, upper_bounds, name):
+    """
+    Creates one continuous variable per plane.
+
+    Args:
+        solver (pywraplp.Solver): The solver that owns the variables.
+        lower_bounds (list): Lower bound of each variable.
+        upper_bounds (list): Upper bound of each variable.
+        name (str): Prefix of the variable names, or None to leave them unnamed.
+
+    Returns:
+        list: The variables, indexed by plane.
+    """
+    num_var = solver.NumVar
+    if name is None:
+        return [num_var(lb, ub, "") for lb, ub in zip(lower_bounds, upper_bounds)]
+    return [
+        num_var(lb, ub, f"{name}_{i}")
+        for i, (lb, ub) in enumerate(zip(lower_bounds, upper_bounds))
+    ]
+
+
+def _bool_var_dict(solver, keys, name):
+    """
+    Creates one binary variable per index pair.
+
+    Args:
+        solver (pywraplp.Solver): The solver that owns the variables.
+        keys (list): The (i, j) index pairs.
+        name (str): Prefix of the variable names, or None to leave them unnamed.
+
+    Returns:
+        dict: The variables, keyed by index pair.
+    """
+    bool_var = solver.BoolVar
+    if name is None:
+        return {key: bool_var("") for key in keys}
+    return {(i, j): bool_var(f"{name}_{i}_{j}") for i, j in keys}
+
+
+def _add_order_term(row, landing_order, i, j, coefficient):
+    """
+    Adds coefficient * delta_ij to a row, where only delta_ij with i < j is a variable.
+
+    Args:
+        row (pywraplp.Constraint): The row being built.
+        landing_order (dict): The landing order variables, keyed by (i, j) with i < j.
+        i (int): The plane landing first.
+        j (int): The plane landing second.
+        coefficient (float): The coefficient of delta_ij.
+
+    Returns:
+        float: The constant part of the term (coefficient when delta_ij = 1 - delta_ji),
+            to be moved to the bounds of the row.
+    """
+    if i < j:
+        variable, constant = landing_order[(i, j)], 0
+    else:
+        variable, constant, coefficient = landing_order[(j, i)], coefficient, -coefficient
+    row.SetCoefficient(variable, row.GetCoefficient(variable) + coefficient)
+    return constant
+
+
+def _add_greedy_hint(solver, variables, planes_data, separation_times, num_runways=1):
+    """
+    Hints the first-come-first-served schedule to the solver, with the deviations,
+    landing orders and runway assignments it implies.
+
+    Args:
+        solver (pywraplp.Solver): The solver that owns the variables.
+        variables (dict): A dictionary containing the decision variables.
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        num_runways (int): The number of runways.
+    """
+    landing_times, runways = greedy_schedule(planes_data, separation_times, num_runways)
+
+    hint_variables = list(variables["landing_time"])
+    hint_values = list(landing_times)
+    for i, p in enumerate(planes_data):
+        target_i = p["target_landing_time"]
+        hint_variables += [variables["early_deviation"][i], variables["late_deviation"][i]]
+        hint_values += [
+            max(target_i - landing_times[i], 0),
+            max(landing_times[i] - target_i, 0),
+        ]
+
+    for (i, j), variable in variables["landing_order"].items():
+        hint_variables.append(variable)
+        hint_values.append(int((landing_times[i], i) < (landing_times[j], j)))
+    for (i, r), variable in variables.get("landing_runway", {}).items():
+        hint_variables.append(variable)
+        hint_values.append(int(runways[i] == r))
+    for (i, j), variable in variables.get("same_runway", {}).items():
+        hint_variables.append(variable)
+        hint_values.append(int(runways[i] == runways[j]))
+
+    # SetHint replaces the previous hint, so the whole schedule goes in one call
+    solver.SetHint(hint_variables, hint_values)
+
+
+def _print_missed_targets(num_planes, planes_data, variables):
+    """
+    Prints the planes of a MIP solution that did not land on their target time.
+
+    Args:
+        num_planes (int): The number of planes.
+        planes_data (list): A list of dictionaries containing plane data.
+        variables (dict): A dictionary containing the decision variables.
+    """
+    lines = ["\n-> Planes that did not land on the target time:"]
+    for i in range(num_planes):
+        e_ = variables["early_deviation"][i].solution_value()
+        L_ = variables["late_deviation"][i].solution_value()
+        # If early_deviation or late_deviation > 0, plane missed its target
+        if e_ > 0 or L_ > 0:
+            penalty = (
+                e_ * planes_data[i]["penalty_early"]
+                + L_ * planes_data[i]["penalty_late"]
+            )
+            landing_t = variables["landing_time"][i].solution_value()
+            target_t = planes_data[i]["target_landing_time"]
+            lines.append(
+                f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
+            )
+    print("\n".join(lines))
 
 
 def create_mip_model_multiple_runways(
@@ -7,219 +154,174 @@ def create_mip_model_multiple_runways(
     planes_data,
     separation_times,
     num_runways,
+    debug_names=False,
 ):
     print("=" * 60)
     print("\t\t    Creating MIP Solver")
     print("=" * 60, "\n")
 
+    separation_times = separation_rows(separation_times)
+
     # Create the LP solver
     solver = pywraplp.Solver.CreateSolver("SAT")  # Using the SAT solver
     variables = {}
 
+    earliest, target, latest, penalty_early, penalty_late = extract_plane_arrays(
+        planes_data
+    )
+    unordered_pairs = [
+        (i, j) for i in range(num_planes) for j in range(i + 1, num_planes)
+    ]
+
     # Decision Variables
     # x_i: Landing time for plane i
     # (1)
-    landing_times = [
-        solver.NumVar(
-            planes_data[i]["earliest_landing_time"],
-            planes_data[i]["latest_landing_time"],
-            f"LandingTime_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    landing_times = _num_var_array(
+        solver, earliest, latest, "LandingTime" if debug_names else None
+    )
     variables["landing_time"] = landing_times
 
-    # delta_ij:  Fraction representing if plane i lands before plane j (0 to 1)
-    # Note: In a pure LP model, we relax the integrality constraint.
-    landing_order = {}
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                landing_order[(i, j)] = solver.NumVar(0, 1, f"LandingOrder_{i}_{j}")
+    # delta_ij:  1 if plane i lands before plane j, 0 otherwise
+    # Only delta_ij with i < j is created, delta_ji is substituted by 1 - delta_ij (2)
+    landing_order = _bool_var_dict(
+        solver, unordered_pairs, "LandingOrder" if debug_names else None
+    )
     variables["landing_order"] = landing_order
 
+    def lo(i, j):
+        return landing_order[(i, j)] if i < j else 1 - landing_order[(j, i)]
+
     # alpha_i: Time by which plane i lands before its target time
-    early_deviation = [
-        solver.NumVar(
-            0,
-            max(
-                planes_data[i]["target_landing_time"]
-                - planes_data[i]["earliest_landing_time"],
-                0,
-            ),
-            f"EarlyDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    early_deviation = _num_var_array(
+        solver,
+        [0] * num_planes,
+        [max(t - e, 0) for t, e in zip(target, earliest)],
+        "EarlyDeviation" if debug_names else None,
+    )
     variables["early_deviation"] = early_deviation
 
     # beta_i: Time by which plane i lands after its target time
-    late_deviation = [
-        solver.NumVar(
-            0,
-            max(
-                planes_data[i]["latest_landing_time"]
-                - planes_data[i]["target_landing_time"],
-                0,
-            ),
-            f"LateDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    late_deviation = _num_var_array(
+        solver,
+        [0] * num_planes,
+        [max(l - t, 0) for l, t in zip(latest, target)],
+        "LateDeviation" if debug_names else None,
+    )
     variables["late_deviation"] = late_deviation
 
-    # z_ij: 1 if plane i and plane j land on the same runway, 0 otherwise
-    same_runway = {}
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                same_runway[(i, j)] = solver.NumVar(0, 1, f"SameRunway_{i}_{j}")
+    # With a single runway every pair shares it, so z_ij = 1 and y_i0 = 1
+    # are folded into the constraints instead of being created
+    multiple_runways = num_runways > 1
 
+    # z_ij: 1 if plane i and plane j land on the same runway, 0 otherwise
+    # z_ij and z_ji are the same variable, stored once under (min(i, j), max(i, j))
+    same_runway = _bool_var_dict(
+        solver,
+        unordered_pairs if multiple_runways else [],
+        "SameRunway" if debug_names else None,
+    )
     variables["same_runway"] = same_runway
 
-    # y_ir: 1 if plane i lands on runway r, 0 otherwise
-    landing_runway = {}
-    for i in range(num_planes):
-        for r in range(num_runways):
-            landing_runway[(i, r)] = solver.NumVar(0, 1, f"LandingRunway_{i}_{r}")
+    def sr(i, j):
+        if not multiple_runways:
+            return 1
+        return same_runway[(i, j)] if i < j else same_runway[(j, i)]
 
+    # y_ir: 1 if plane i lands on runway r, 0 otherwise
+    landing_runway = _bool_var_dict(
+        solver,
+        [(i, r) for i in range(num_planes) for r in range(num_runways)]
+        if multiple_runways
+        else [],
+        "LandingRunway" if debug_names else None,
+    )
     variables["landing_runway"] = landing_runway
 
     # Constraints
-    # (2)
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            solver.Add(landing_order[(i, j)] + landing_order[(j, i)] == 1)
-
-    # Set W
-    # (3)
-    certain_with_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij <= earliest_j:
-                    certain_with_separation_pairs.append((i, j))
-
-    # Set V
-    # (4)
-    certain_with_no_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij > earliest_j:
-                    certain_with_no_separation_pairs.append((i, j))
-
-    # Set U
-    # (5)
-    uncertain_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j, latest_j = (
-                    planes_data[j]["earliest_landing_time"],
-                    planes_data[j]["latest_landing_time"],
-                )
-
-                if (
-                    (earliest_j <= earliest_i <= latest_j)
-                    or (earliest_j <= latest_i <= latest_j)
-                ) or (
-                    (earliest_i <= earliest_j <= latest_i)
-                    or (earliest_i <= latest_j <= latest_i)
-                ):
-                    uncertain_pairs.append((i, j))
+    # Set W (3), Set V (4) and Set U (5)
+    (
+        certain_with_separation_pairs,
+        certain_with_no_separation_pairs,
+        uncertain_pairs,
+    ) = classify_pairs(earliest, latest, separation_times)
 
     # Enforce separation for pairs where order is determined (Set V)
     # (6) and (7)
     for i, j in certain_with_no_separation_pairs:
-        solver.Add(landing_order[(i, j)] == 1)  # (6)
+        solver.Add(lo(i, j) == 1)  # (6)
         solver.Add(
             landing_times[j]
-            >= landing_times[i] + separation_times[i][j] * same_runway[(i, j)]
+            >= landing_times[i] + separation_times[i][j] * sr(i, j)
         )  # (7)
 
     # Enforce order for pairs where order is determined and separation is automatic (Set W)
     # (6)
     for i, j in certain_with_separation_pairs:
-        solver.Add(landing_order[(i, j)] == 1)  # (6)
-
-    for i, j in uncertain_pairs:
-        # solver.Add(landing_times[j] >= landing_times[i] + separation_times[i][j] * same_runway[(i, j)] + separation_times_between_runways[(i, j)] * (1 - same_runway[(i, j)]) - M * (landing_order[(j, i)])) # (8)
-        latest_i = planes_data[i]["latest_landing_time"]
-        earliest_j = planes_data[j]["earliest_landing_time"]
+        solver.Add(lo(i, j) == 1)  # (6)
 
-        solver.Add(
-            landing_times[j]
-            >= landing_times[i]
-            + separation_times[i][j] * same_runway[(i, j)]
-            - (latest_i + separation_times[i][j] - earliest_j) * (landing_order[(j, i)])
-        )  # (8)
+    separations, gaps = pair_coefficients(
+        uncertain_pairs, earliest, latest, separation_times
+    )
+    infinity = solver.infinity()
+    for (i, j), separation_ij, gap_ij in zip(uncertain_pairs, separations, gaps):
+        # (8), with the tight per-pair big-M L_i + S_ij - E_j:
+        # x_j - x_i - S_ij * z_ij + (L_i + S_ij - E_j) * delta_ji >= 0
+        row = solver.RowConstraint(0, infinity)
+        row.SetCoefficient(landing_times[j], 1)
+        row.SetCoefficient(landing_times[i], -1)
+        lower_bound = 0
+        if multiple_runways:
+            row.SetCoefficient(sr(i, j), -separation_ij)
+        else:
+            lower_bound += separation_ij
+        lower_bound -= _add_order_term(
+            row, landing_order, j, i, gap_ij + separation_ij
+        )
+        row.SetLb(lower_bound)
 
     # 4. Relating Deviation Variables to Landing Times
+    # (15) and (17) are the domains of the deviations, and with alpha_i, beta_i >= 0
+    # (18) implies (14) alpha_i >= T_i - x_i and (16) beta_i >= x_i - T_i. The objective
+    # keeps at most one of them positive, so (18) is the only row needed.
     for i in range(num_planes):
-        earliest_i = planes_data[i]["earliest_landing_time"]
-        latest_i = planes_data[i]["latest_landing_time"]
-        target_i = planes_data[i]["target_landing_time"]
-
-        # (14)
-        solver.Add(early_deviation[i] >= target_i - landing_times[i])
-
-        # (15)
-        solver.Add(early_deviation[i] >= 0)
-        solver.Add(early_deviation[i] <= target_i - earliest_i)
-
-        # (16)
-        solver.Add(late_deviation[i] >= landing_times[i] - target_i)
-
-        # (17)
-        solver.Add(late_deviation[i] >= 0)
-        solver.Add(late_deviation[i] <= latest_i - target_i)
-
         # (18)
         solver.Add(
-            landing_times[i] == target_i - early_deviation[i] + late_deviation[i]
+            landing_times[i] == target[i] - early_deviation[i] + late_deviation[i]
         )
 
     # New constraints for multiple runways
-    # (28)
-    for i in range(num_planes):
-        solver.Add(solver.Sum(landing_runway[(i, r)] for r in range(num_runways)) == 1)
-
-    # (29)
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            solver.Add(same_runway[(i, j)] == same_runway[(j, i)])
-
-    # (30)
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
+    if multiple_runways:
+        # (28)
+        for i in range(num_planes):
+            row = solver.RowConstraint(1, 1, f"OneRunway_{i}" if debug_names else "")
             for r in range(num_runways):
-                solver.Add(
-                    same_runway[(i, j)]
-                    >= landing_runway[(i, r)] + landing_runway[(j, r)] - 1
-                )
+                row.SetCoefficient(landing_runway[(i, r)], 1)
+
+        # (30)
+        # Only pairs in V or U read same_runway, for W the separation is automatic
+        shared_runway_pairs = sorted(
+            {
+                (min(i, j), max(i, j))
+                for i, j in certain_with_no_separation_pairs + uncertain_pairs
+            }
+        )
+        for r in range(num_runways):
+            on_runway = [landing_runway[(i, r)] for i in range(num_planes)]
+            for i, j in shared_runway_pairs:
+                row = solver.RowConstraint(-1, infinity)
+                row.SetCoefficient(same_runway[(i, j)], 1)
+                row.SetCoefficient(on_runway[i], -1)
+                row.SetCoefficient(on_runway[j], -1)
 
     objective = solver.Objective()
+    set_coefficient = objective.SetCoefficient
 
-    for i in range(num_planes):
-        objective.SetCoefficient(early_deviation[i], planes_data[i]["penalty_early"])
-        objective.SetCoefficient(late_deviation[i], planes_data[i]["penalty_late"])
+    # Variables with a zero penalty are left out of the objective
+    for deviation, penalty in zip(
+        early_deviation + late_deviation, penalty_early + penalty_late
+    ):
+        if penalty:
+            set_coefficient(deviation, penalty)
 
     objective.SetMinimization()
 
@@ -230,255 +332,160 @@ def create_mip_model_multiple_runways(
 
 
 def solve_multiple_runways_mip(
-    num_planes, num_runways, planes_data, separation_times, hint=False
+    num_planes,
+    num_runways,
+    planes_data,
+    separation_times,
+    hint=False,
+    debug_names=False,
+    num_workers=None,
 ):
     solver, variables = create_mip_model_multiple_runways(
-        num_planes, planes_data, separation_times, num_runways
+        num_planes, planes_data, separation_times, num_runways, debug_names
     )
 
     if hint:
-        # get all the target landing times to a list
-        target_times = [
-            planes_data[i]["target_landing_time"] for i in range(num_planes)
-        ]
-
-        for i in range(num_planes):
-            solver.SetHint(variables["landing_time"], target_times)
+        _add_greedy_hint(solver, variables, planes_data, separation_times, num_runways)
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving MIP")
     print("=" * 60, "\n")
 
+    # Run the CP-SAT backend as a parallel portfolio
+    solver.SetNumThreads(num_workers or DEFAULT_NUM_WORKERS)
+
     # Solve the model with performance tracking
     status = solver.Solve()
 
-    landing_time = variables["landing_time"]
-    early_deviation = variables["early_deviation"]
-    late_deviation = variables["late_deviation"]
-
     if status == pywraplp.Solver.OPTIMAL:
         print(f"-> Optimal Cost: {solver.Objective().Value()}")
 
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = variables["early_deviation"][i].solution_value()
-            L_ = variables["late_deviation"][i].solution_value()
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = variables["landing_time"][i].solution_value()
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(num_planes, planes_data, variables)
     elif status == pywraplp.Solver.FEASIBLE:
         # -------------------------------
         # No optimal solution
         # -------------------------------
         print("-> No optimal solution found.")
 
-        print("-> Best feasible solution found:", round(solver.ObjectiveValue(), 2))
+        print("-> Best feasible solution found:", round(solver.Objective().Value(), 2))
 
         # You can optionally also list planes that missed their target
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            if e_ > 0 or L_ > 0:
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(num_planes, planes_data, variables)
     else:
         print(
-            "-> No feasible/optimal solution found. Status:", solver.StatusName(status)
+            "-> No feasible/optimal solution found. Status:", _STATUS_NAMES.get(status, status)
         )
 
     # Return the solver, variables, number of planes and the number of runways
     return solver
 
 
-def create_mip_model_single_runway(num_planes, planes_data, separation_times):
+def create_mip_model_single_runway(
+    num_planes, planes_data, separation_times, debug_names=False
+):
     print("=" * 60)
     print("\t\t    Creating MIP Solver")
     print("=" * 60, "\n")
 
+    separation_times = separation_rows(separation_times)
+
     # Create the LP solver
     solver = pywraplp.Solver.CreateSolver("SAT")
     variables = {}
 
+    earliest, target, latest, penalty_early, penalty_late = extract_plane_arrays(
+        planes_data
+    )
+    unordered_pairs = [
+        (i, j) for i in range(num_planes) for j in range(i + 1, num_planes)
+    ]
+
     # Decision Variables
     # x_i: Landing time for plane i
     # (1)
-    landing_times = [
-        solver.NumVar(
-            planes_data[i]["earliest_landing_time"],
-            planes_data[i]["latest_landing_time"],
-            f"LandingTime_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    landing_times = _num_var_array(
+        solver, earliest, latest, "LandingTime" if debug_names else None
+    )
     variables["landing_time"] = landing_times
 
-    # delta_ij:  Fraction representing if plane i lands before plane j (0 to 1)
-    # Note: In a pure LP model, we relax the integrality constraint.
-    landing_order = {}
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                landing_order[(i, j)] = solver.NumVar(0, 1, f"LandingOrder_{i}_{j}")
+    # delta_ij:  1 if plane i lands before plane j, 0 otherwise
+    # Only delta_ij with i < j is created, delta_ji is substituted by 1 - delta_ij (2)
+    landing_order = _bool_var_dict(
+        solver, unordered_pairs, "LandingOrder" if debug_names else None
+    )
     variables["landing_order"] = landing_order
 
+    def lo(i, j):
+        return landing_order[(i, j)] if i < j else 1 - landing_order[(j, i)]
+
     # alpha_i: Time by which plane i lands before its target time
-    early_deviation = [
-        solver.NumVar(
-            0,
-            max(
-                planes_data[i]["target_landing_time"]
-                - planes_data[i]["earliest_landing_time"],
-                0,
-            ),
-            f"EarlyDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    early_deviation = _num_var_array(
+        solver,
+        [0] * num_planes,
+        [max(t - e, 0) for t, e in zip(target, earliest)],
+        "EarlyDeviation" if debug_names else None,
+    )
     variables["early_deviation"] = early_deviation
 
     # beta_i: Time by which plane i lands after its target time
-    late_deviation = [
-        solver.NumVar(
-            0,
-            max(
-                planes_data[i]["latest_landing_time"]
-                - planes_data[i]["target_landing_time"],
-                0,
-            ),
-            f"LateDeviation_{i}",
-        )
-        for i in range(num_planes)
-    ]
+    late_deviation = _num_var_array(
+        solver,
+        [0] * num_planes,
+        [max(l - t, 0) for l, t in zip(latest, target)],
+        "LateDeviation" if debug_names else None,
+    )
     variables["late_deviation"] = late_deviation
 
     # Constraints
-    # (2)
-    for i in range(num_planes):
-        for j in range(i + 1, num_planes):
-            solver.Add(landing_order[(i, j)] + landing_order[(j, i)] == 1)
-
-    # Set V
-    certain_with_no_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij > earliest_j:
-                    certain_with_no_separation_pairs.append((i, j))
-
-    # Set W
-    certain_with_separation_pairs = []
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j = planes_data[j]["earliest_landing_time"]
-                separation_ij = separation_times[i][j]
-                if latest_i < earliest_j and latest_i + separation_ij <= earliest_j:
-                    certain_with_separation_pairs.append((i, j))
-
-    uncertain_pairs = []
-
-    # Set U
-    for i in range(num_planes):
-        for j in range(num_planes):
-            if i != j:
-                earliest_i, latest_i = (
-                    planes_data[i]["earliest_landing_time"],
-                    planes_data[i]["latest_landing_time"],
-                )
-                earliest_j, latest_j = (
-                    planes_data[j]["earliest_landing_time"],
-                    planes_data[j]["latest_landing_time"],
-                )
-
-                if (
-                    (earliest_j <= earliest_i <= latest_j)
-                    or (earliest_j <= latest_i <= latest_j)
-                ) or (
-                    (earliest_i <= earliest_j <= latest_i)
-                    or (earliest_i <= latest_j <= latest_i)
-                ):
-                    uncertain_pairs.append((i, j))
+    # Sets W, V and U
+    (
+        certain_with_separation_pairs,
+        certain_with_no_separation_pairs,
+        uncertain_pairs,
+    ) = classify_pairs(earliest, latest, separation_times)
 
     # Enforce separation for pairs where order is determined (Set V)
     for i, j in certain_with_no_separation_pairs:
-        solver.Add(landing_order[(i, j)] == 1)
+        solver.Add(lo(i, j) == 1)
         solver.Add(landing_times[j] >= landing_times[i] + separation_times[i][j])
 
     # Enforce order for pairs where order is determined and separation is automatic (Set W)
     for i, j in certain_with_separation_pairs:
-        solver.Add(landing_order[(i, j)] == 1)
-
-    for i, j in uncertain_pairs:
-        latest_i = planes_data[i]["latest_landing_time"]
-        earliest_j = planes_data[j]["earliest_landing_time"]
-        separation_ij = separation_times[i][j]
-        delta_ij = landing_order[(i, j)]
-        delta_ji = landing_order[(j, i)]
+        solver.Add(lo(i, j) == 1)
 
-        solver.Add(
-            landing_times[j]
-            >= landing_times[i]
-            + separation_ij * delta_ij
-            - (latest_i - earliest_j) * delta_ji
-        )  # (11)
+    separations, gaps = pair_coefficients(
+        uncertain_pairs, earliest, latest, separation_times
+    )
+    infinity = solver.infinity()
+    for (i, j), separation_ij, gap_ij in zip(uncertain_pairs, separations, gaps):
+        # (11): x_j - x_i - S_ij * delta_ij + (L_i - E_j) * delta_ji >= 0
+        row = solver.RowConstraint(0, infinity)
+        row.SetCoefficient(landing_times[j], 1)
+        row.SetCoefficient(landing_times[i], -1)
+        lower_bound = 0
+        lower_bound -= _add_order_term(row, landing_order, i, j, -separation_ij)
+        lower_bound -= _add_order_term(row, landing_order, j, i, gap_ij)
+        row.SetLb(lower_bound)
 
     # 4. Relating Deviation Variables to Landing Times
+    # (15) and (17) are the domains of the deviations, and with alpha_i, beta_i >= 0
+    # (18) implies (14) alpha_i >= T_i - x_i and (16) beta_i >= x_i - T_i. The objective
+    # keeps at most one of them positive, so (18) is the only row needed.
     for i in range(num_planes):
-        earliest_i = planes_data[i]["earliest_landing_time"]
-        latest_i = planes_data[i]["latest_landing_time"]
-        target_i = planes_data[i]["target_landing_time"]
-
-        # (14)
-        solver.Add(early_deviation[i] >= target_i - landing_times[i])
-
-        # (15)
-        solver.Add(early_deviation[i] >= 0)
-        solver.Add(early_deviation[i] <= target_i - earliest_i)
-
-        # (16)
-        solver.Add(late_deviation[i] >= landing_times[i] - target_i)
-
-        # (17)
-        solver.Add(late_deviation[i] >= 0)
-        solver.Add(late_deviation[i] <= latest_i - target_i)
-
         # (18)
         solver.Add(
-            landing_times[i] == target_i - early_deviation[i] + late_deviation[i]
+            landing_times[i] == target[i] - early_deviation[i] + late_deviation[i]
         )
 
     objective = solver.Objective()
+    set_coefficient = objective.SetCoefficient
 
-    for i in range(num_planes):
-        objective.SetCoefficient(early_deviation[i], planes_data[i]["penalty_early"])
-        objective.SetCoefficient(late_deviation[i], planes_data[i]["penalty_late"])
+    # Variables with a zero penalty are left out of the objective
+    for deviation, penalty in zip(
+        early_deviation + late_deviation, penalty_early + penalty_late
+    ):
+        if penalty:
+            set_coefficient(deviation, penalty)
 
     objective.SetMinimization()
 
@@ -488,76 +495,48 @@ def create_mip_model_single_runway(num_planes, planes_data, separation_times):
     return solver, variables
 
 
-def solve_single_runway_mip(num_planes, planes_data, separation_times, hint=False):
+def solve_single_runway_mip(
+    num_planes,
+    planes_data,
+    separation_times,
+    hint=False,
+    debug_names=False,
+    num_workers=None,
+):
     solver, variables = create_mip_model_single_runway(
-        num_planes, planes_data, separation_times
+        num_planes, planes_data, separation_times, debug_names
     )
 
     if hint:
-        # get all the target landing times to a list
-        target_times = [
-            planes_data[i]["target_landing_time"] for i in range(num_planes)
-        ]
-
-        for i in range(num_planes):
-            solver.SetHint(variables["landing_time"], target_times)
+        _add_greedy_hint(solver, variables, planes_data, separation_times)
 
     print("\n" + "=" * 60)
     print("\t\t\tSolving MIP")
     print("=" * 60, "\n")
 
+    # Run the CP-SAT backend as a parallel portfolio
+    solver.SetNumThreads(num_workers or DEFAULT_NUM_WORKERS)
+
     # Solve the model with performance tracking
     status = solver.Solve()
 
-    landing_time = variables["landing_time"]
-    early_deviation = variables["early_deviation"]
-    late_deviation = variables["late_deviation"]
-
     if status == pywraplp.Solver.OPTIMAL:
         print(f"-> Optimal Cost: {solver.Objective().Value()}")
 
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = variables["early_deviation"][i].solution_value()
-            L_ = variables["late_deviation"][i].solution_value()
-            # If early_deviation or late_deviation > 0, plane missed its target
-            if e_ > 0 or L_ > 0:
-                # Calculate penalty
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = variables["landing_time"][i].solution_value()
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(num_planes, planes_data, variables)
     elif status == pywraplp.Solver.FEASIBLE:
         # -------------------------------
         # No optimal solution
         # -------------------------------
         print("-> No optimal solution found.")
 
-        print("-> Best feasible solution found:", round(solver.ObjectiveValue(), 2))
+        print("-> Best feasible solution found:", round(solver.Objective().Value(), 2))
 
         # You can optionally also list planes that missed their target
-        print("\n-> Planes that did not land on the target time:")
-        for i in range(num_planes):
-            e_ = solver.Value(early_deviation[i])
-            L_ = solver.Value(late_deviation[i])
-            if e_ > 0 or L_ > 0:
-                penalty = (
-                    e_ * planes_data[i]["penalty_early"]
-                    + L_ * planes_data[i]["penalty_late"]
-                )
-                landing_t = solver.Value(landing_time[i])
-                target_t = planes_data[i]["target_landing_time"]
-                print(
-                    f"  -> Plane {i}: {landing_t} | Target Time: {target_t} | Penalty: {penalty}"
-                )
+        _print_missed_targets(num_planes, planes_data, variables)
     else:
         print(
-            "-> No feasible/optimal solution found. Status:", solver.StatusName(status)
+            "-> No feasible/optimal solution found. Status:", _STATUS_NAMES.get(status, status)
         )
 
     return solver, variables
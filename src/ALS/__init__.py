@@ -1,4 +1,5 @@
 from .MIP import solve_multiple_runways_mip
 from .CP import solve_multiple_runways_cp
 from .CP import solve_single_runway_cp
+from .CP import est_decision_strategies
 from .utils import read_data 
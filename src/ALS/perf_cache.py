@@ -0,0 +1,87 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
+
+from .utils import extract_plane_arrays
+
+_DEFAULT_CACHE_DIR = ".perfcache"
+
+
+def instance_key(planes_data, separation_times, num_runways, *settings):
+    """
+    Hashes an instance and the settings it is solved with into a cache key.
+
+    Args:
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (np.ndarray or list of lists): The separation times.
+        num_runways (int): The number of runways.
+        *settings: Anything else that changes the result, such as the approach or the
+            search strategy. Their repr is part of the key.
+
+    Returns:
+        str: The BLAKE2b hex digest of the instance and settings.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for column in extract_plane_arrays(planes_data):
+        digest.update(np.asarray(column, dtype=np.float64).tobytes())
+    digest.update(np.asarray(separation_times, dtype=np.int64).tobytes())
+    digest.update(repr((num_runways,) + settings).encode())
+    return digest.hexdigest()
+
+
+def load_metrics(key, cache_dir=_DEFAULT_CACHE_DIR):
+    """
+    Reads the metrics stored for a key.
+
+    Args:
+        key (str): The key from instance_key.
+        cache_dir (str): The directory of the cache.
+
+    Returns:
+        dict: The stored metrics, or None if the key is not cached.
+    """
+    try:
+        with open(os.path.join(cache_dir, key + ".pkl"), "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def store_metrics(key, metrics, cache_dir=_DEFAULT_CACHE_DIR):
+    """
+    Stores the metrics of a key, replacing any previous entry.
+
+    Args:
+        key (str): The key from instance_key.
+        metrics (dict): The metrics returned by performance_CP or performance_MIP.
+        cache_dir (str): The directory of the cache.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, key + ".pkl")
+
+    # Write to a temporary file first so a crash never leaves a truncated entry
+    with open(path + ".tmp", "wb") as f:
+        pickle.dump(metrics, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+
+
+def cached_metrics(key, solve_and_measure, cache_dir=_DEFAULT_CACHE_DIR):
+    """
+    Returns the cached metrics of a key, solving and measuring only on a cache miss.
+
+    Args:
+        key (str): The key from instance_key.
+        solve_and_measure (function): Solves the instance and returns its metrics, for
+            example by calling a solve function and then performance_CP.
+        cache_dir (str): The directory of the cache.
+
+    Returns:
+        dict: The metrics of the instance.
+    """
+    metrics = load_metrics(key, cache_dir)
+    if metrics is None:
+        metrics = solve_and_measure()
+        store_metrics(key, metrics, cache_dir)
+    return metrics
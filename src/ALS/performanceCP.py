@@ -1,14 +1,15 @@
-from ortools.sat.python import cp_model
+class PerformanceTracker:
+    __slots__ = ("solver", "model", "planes_data", "_metrics")
 
-class PerformanceTracker(cp_model.CpSolverSolutionCallback):
     def __init__(self, solver, model, planes_data):
-        super().__init__()
-
         # Store solver reference to access performance metrics
         self.solver = solver
         self.model = model
         self.planes_data = planes_data
 
+        # Metrics of the finished solve, collected on first use
+        self._metrics = None
+
     def getStatus(self):
         return self.solver.StatusName()
 
@@ -33,6 +34,9 @@ class PerformanceTracker(cp_model.CpSolverSolutionCallback):
     def get_performance_metrics(self):
         """Returns solver performance metrics after solving as a dictionary."""
 
+        if self._metrics is not None:
+            return self._metrics
+
         # Coletar as métricas
         exec_time = self.getWallTime()
         num_variables = self.getNumVariables()
@@ -53,6 +57,7 @@ class PerformanceTracker(cp_model.CpSolverSolutionCallback):
             "best_objective": best_objective
         }
 
+        self._metrics = metrics
         return metrics
 
     def print_performance_metrics(self):  
@@ -68,18 +73,22 @@ class PerformanceTracker(cp_model.CpSolverSolutionCallback):
         branches = metrics["branches"]
         best_objective = metrics["best_objective"]
 
-        print()
-        print("=" * 60)
-        print("\t\tPerformance Metrics for CP")
-        print("=" * 60, "\n")
-        print(f"-> Execution time (s): {exec_time:.2f}")
-        print(f"-> Number of variables: {num_variables}")
-        print(f"-> Number of constraints: {num_constraints}")
-        print(f"-> Solution Status: {status}")
-        print(f"-> Number of Conflicts: {conflicts}")
-        print(f"-> Number of Branches: {branches}")
-        print(f"-> Best objective bound: {best_objective:.1f}")
-        print("\n" + "=" * 60)
+        # Build the report and print it in one write
+        lines = [
+            "",
+            "=" * 60,
+            "\t\tPerformance Metrics for CP",
+            "=" * 60 + " \n",
+            f"-> Execution time (s): {exec_time:.2f}",
+            f"-> Number of variables: {num_variables}",
+            f"-> Number of constraints: {num_constraints}",
+            f"-> Solution Status: {status}",
+            f"-> Number of Conflicts: {conflicts}",
+            f"-> Number of Branches: {branches}",
+            f"-> Best objective bound: {best_objective:.1f}",
+            "\n" + "=" * 60,
+        ]
+        print("\n".join(lines))
 
         return metrics 
 
@@ -1,39 +1,3 @@
-def calculate_execution_time(solver):
-    """
-    Calculates the total execution time of the solver.
-    
-    Args:
-        solver: The OR-Tools solver instance.
-        
-    Returns:
-        float: Execution time in seconds.
-    """
-    return solver.WallTime() / 1000  # Convert milliseconds to seconds
-
-def calculate_num_variables(solver):
-    """
-    Calculates the total number of variables in the model.
-    
-    Args:
-        solver: The OR-Tools solver instance.
-    
-    Returns:
-        int: The total number of variables.
-    """
-    return solver.NumVariables()
-
-def calculate_num_constraints(solver):
-    """
-    Calculates the total number of constraints in the model.
-    
-    Args:
-        solver: The OR-Tools solver instance.
-    
-    Returns:
-        int: The total number of constraints.
-    """
-    return solver.NumConstraints()
-
 def performance_MIP(solver):
     """
     Calculates and prints metrics specific to MIP problems.
@@ -44,29 +8,25 @@ def performance_MIP(solver):
     Returns:
         dict: Dictionary containing all calculated metrics.
     """
-    print()
-    print("=" * 60)
-    print("\t\tPerformance Metrics for MIP")
-    print("=" * 60, "\n")
-    
-    # Execution time
-    exec_time = calculate_execution_time(solver)
-    print(f"-> Execution time: {exec_time:.2f} seconds")
-
-    # Number of variables
-    num_variables = calculate_num_variables(solver)
-    print(f"-> Number of variables in the model: {num_variables}")
-
-    # Number of constraints
-    num_constraints = calculate_num_constraints(solver)
-    print(f"-> Number of constraints in the model: {num_constraints}")
-
-    # Total penalty
+    exec_time = solver.WallTime() / 1000  # milliseconds to seconds
+    num_variables = solver.NumVariables()
+    num_constraints = solver.NumConstraints()
     total_penalty = solver.Objective().Value()
-    print(f"-> Total penalty: {total_penalty:.1f}")
 
-    print("\n" + "=" * 60)
-    
+    # Build the report and print it in one write
+    lines = [
+        "",
+        "=" * 60,
+        "\t\tPerformance Metrics for MIP",
+        "=" * 60 + " \n",
+        f"-> Execution time: {exec_time:.2f} seconds",
+        f"-> Number of variables in the model: {num_variables}",
+        f"-> Number of constraints in the model: {num_constraints}",
+        f"-> Total penalty: {total_penalty:.1f}",
+        "\n" + "=" * 60,
+    ]
+    print("\n".join(lines))
+
     # Create and return a dictionary with the metrics
     metrics = {
         "exec_time": exec_time,
@@ -74,6 +34,5 @@ def performance_MIP(solver):
         "num_constraints": num_constraints,
         "best_objective": total_penalty,
     }
-    
-    return metrics
 
+    return metrics
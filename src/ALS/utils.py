@@ -1,3 +1,16 @@
+import os
+
+import numpy as np
+from ortools.sat.python import cp_model
+import psutil
+
+# Default number of solver workers for every model: one per physical core, capped at
+# 16 since CP-SAT scales well up to about 16 portfolio workers. More workers than cores
+# only time-slice and stretch the wall time past the time limit. Counting the cores
+# reads /proc, so it is done once.
+DEFAULT_NUM_WORKERS = min(16, psutil.cpu_count(logical=False) or os.cpu_count() or 8)
+
+
 def read_data(filename):
     """
     Reads data from a file with the specified format for an air traffic scheduling problem.
@@ -10,47 +23,49 @@ def read_data(filename):
             - num_planes (int): The number of planes.
             - planes_data (list): A list of dictionaries, where each dictionary contains
               the data for a plane.
-            - separation_times (list of lists): A 2D list of separation times.
+            - separation_times (np.ndarray): A (num_planes, num_planes) int32 matrix of
+              separation times.
     """
     print("=" * 60)
     print("\t       Reading data from", filename.split('/')[-1])
     print("=" * 60, "\n")
     
     try:
+        # The separation rows may be wrapped over several lines, so the file is read as
+        # one flat list of tokens
         with open(filename, "r") as f:
-            # Read the first line: number of planes and freeze time
-            first_line = f.readline().strip().split()
-            num_planes = int(first_line[0])
-            _ = int(first_line[1])
-
-            planes_data = []
-            separation_times = []
-
-            for _ in range(num_planes):
-                line = f.readline().strip().split()
-                appearance_time = int(line[0])
-                earliest_landing_time = int(line[1])
-                target_landing_time = int(line[2])
-                latest_landing_time = int(line[3])
-                penalty_early = float(line[4])
-                penalty_late = float(line[5])
-                planes_data.append(
-                    {
-                        "appearance_time": appearance_time,
-                        "earliest_landing_time": earliest_landing_time,
-                        "target_landing_time": target_landing_time,
-                        "latest_landing_time": latest_landing_time,
-                        "penalty_early": penalty_early,
-                        "penalty_late": penalty_late,
-                    }
-                )
-
-                separation_row = []
-                while len(separation_row) < num_planes:
-                    line = f.readline().strip().split()
-                    separation_row.extend([int(x) for x in line])
-
-                separation_times.append(separation_row)
+            tokens = f.read().split()
+
+        # First two tokens: number of planes and freeze time
+        num_planes = int(tokens[0])
+        _ = int(tokens[1])
+
+        planes_data = []
+        separation_tokens = []
+        record_size = 6 + num_planes
+        cursor = 2
+
+        for _ in range(num_planes):
+            fields = tokens[cursor : cursor + 6]
+            planes_data.append(
+                {
+                    "appearance_time": int(fields[0]),
+                    "earliest_landing_time": int(fields[1]),
+                    "target_landing_time": int(fields[2]),
+                    "latest_landing_time": int(fields[3]),
+                    "penalty_early": float(fields[4]),
+                    "penalty_late": float(fields[5]),
+                }
+            )
+            separation_tokens.extend(tokens[cursor + 6 : cursor + record_size])
+            cursor += record_size
+
+        if len(separation_tokens) != num_planes * num_planes:
+            raise ValueError("truncated separation times")
+
+        separation_times = np.asarray(separation_tokens, dtype=np.int32).reshape(
+            num_planes, num_planes
+        )
 
         print("-> Number of planes:", num_planes, "\n")
         
@@ -59,10 +74,29 @@ def read_data(filename):
     except FileNotFoundError:
         print(f"-> Error: File '{filename}' not found.")
         return None, None, None, None
-    except ValueError:
+    except (ValueError, IndexError):
         print(f"-> Error: Error reading data in file '{filename}'.")
         return None, None, None, None
 
+def separation_rows(separation_times):
+    """
+    Returns the separation times as lists of Python ints, for the code that reads them
+    pair by pair.
+
+    read_data returns a compact NumPy matrix, but NumPy scalars are slow to index one at
+    a time and do not mix with solver expressions, so model builders convert it once.
+
+    Args:
+        separation_times (np.ndarray or list of lists): The separation times.
+
+    Returns:
+        list of lists: The separation times, with one list per plane.
+    """
+    if isinstance(separation_times, np.ndarray):
+        return separation_times.tolist()
+    return separation_times
+
+
 def get_value(variable, approach, solver):
     """
     Retrieves the value of a variable from a dictionary.
@@ -76,9 +110,385 @@ def get_value(variable, approach, solver):
     Returns:
         float: The value of the variable.
     """
+    value = make_value_getter(approach, solver)
+    return value(variable) if value is not None else None
+
+
+def make_value_getter(approach, solver):
+    """
+    Returns a function that reads the value of a variable, so loops over many variables
+    choose the approach once.
+
+    Args:
+        approach (str): The approach used to solve the problem, "CP" or "MIP".
+        solver: The CP-SAT or pywraplp solver after a successful solve.
+
+    Returns:
+        function: The value getter, or None for an unknown approach.
+    """
     if approach == "CP":
-        return solver.Value(variable)
+        return solver.Value
     elif approach == "MIP":
-        return variable.solution_value()
+        return lambda variable: variable.solution_value()
 
     return None
+
+
+def get_values(variables, approach, solver):
+    """
+    Retrieves the values of a list of variables in one batch.
+
+    Args:
+        variables (list): The variables to read, integer variables for CP.
+        approach (str): The approach used to solve the problem, "CP" or "MIP".
+        solver: The CP-SAT or pywraplp solver after a successful solve.
+
+    Returns:
+        list: The value of each variable, in the same order, or None for an unknown
+            approach.
+    """
+    values = get_value_lists([variables], approach, solver)
+    return values[0] if values is not None else None
+
+
+def get_value_lists(variable_lists, approach, solver):
+    """
+    Retrieves the values of several lists of variables, reading a CP response once.
+
+    Args:
+        variable_lists (list): The lists of variables to read, integer variables for CP.
+        approach (str): The approach used to solve the problem, "CP" or "MIP".
+        solver: The CP-SAT or pywraplp solver after a successful solve.
+
+    Returns:
+        tuple: The values of each list, in the same order, or None for an unknown
+            approach.
+    """
+    if approach == "CP":
+        return solution_value_lists(solver, *variable_lists)
+    elif approach == "MIP":
+        return tuple(
+            [variable.solution_value() for variable in variables]
+            for variables in variable_lists
+        )
+
+    return None
+
+
+def solution_values(solver, variables):
+    """
+    Reads the values of several CP-SAT integer variables in one pass over the response.
+
+    Args:
+        solver (cp_model.CpSolver): The CP-SAT solver after a successful solve.
+        variables (list): The integer variables, not negated literals.
+
+    Returns:
+        list: The value of each variable, in the same order.
+    """
+    return solution_value_lists(solver, variables)[0]
+
+
+def solution_value_lists(solver, *variable_lists):
+    """
+    Reads the values of several lists of CP-SAT integer variables. ResponseProto()
+    copies the whole response, so it is fetched once for all the lists.
+
+    Args:
+        solver (cp_model.CpSolver): The CP-SAT solver after a successful solve.
+        *variable_lists (list): The lists of integer variables, not negated literals.
+
+    Returns:
+        tuple: The values of each list, in the same order.
+    """
+    solution = solver.ResponseProto().solution
+    return tuple(
+        [solution[variable.Index()] for variable in variables]
+        for variables in variable_lists
+    )
+
+
+def extract_plane_arrays(planes_data):
+    """
+    Extracts the time windows and penalties of every plane in a single pass.
+
+    Args:
+        planes_data (list): A list of dictionaries containing plane data.
+
+    Returns:
+        tuple: A tuple containing five lists, one entry per plane:
+            - earliest: the earliest landing times.
+            - target: the target landing times.
+            - latest: the latest landing times.
+            - penalty_early: the penalties per time unit before the target.
+            - penalty_late: the penalties per time unit after the target.
+    """
+    if not planes_data:
+        return [], [], [], [], []
+
+    columns = zip(*(
+        (
+            p["earliest_landing_time"],
+            p["target_landing_time"],
+            p["latest_landing_time"],
+            p["penalty_early"],
+            p["penalty_late"],
+        )
+        for p in planes_data
+    ))
+    return tuple(list(column) for column in columns)
+
+
+def classify_pairs(earliest, latest, separation_times):
+    """
+    Splits the ordered plane pairs into the sets W, V and U of the formulation.
+
+    Args:
+        earliest (list): The earliest landing time of each plane.
+        latest (list): The latest landing time of each plane.
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        tuple: A tuple containing three lists of (i, j) pairs:
+            - W: i certainly lands before j and the separation is automatic.
+            - V: i certainly lands before j but the separation must be enforced.
+            - U: the time windows of i and j overlap, so the order is undecided.
+    """
+    E = np.asarray(earliest, dtype=np.int64)
+    L = np.asarray(latest, dtype=np.int64)
+    S = np.asarray(separation_times, dtype=np.int64)
+
+    ordered = L[:, None] < E[None, :]
+    separated = L[:, None] + S <= E[None, :]
+    overlapping = (E[None, :] <= L[:, None]) & (E[:, None] <= L[None, :])
+    np.fill_diagonal(overlapping, False)
+
+    W = [tuple(pair) for pair in np.argwhere(ordered & separated).tolist()]
+    V = [tuple(pair) for pair in np.argwhere(ordered & ~separated).tolist()]
+    U = [tuple(pair) for pair in np.argwhere(overlapping).tolist()]
+
+    return W, V, U
+
+
+def pair_coefficients(pairs, earliest, latest, separation_times):
+    """
+    Gathers the separation time and the window gap of a list of plane pairs.
+
+    Args:
+        pairs (list): The (i, j) plane pairs.
+        earliest (list): The earliest landing time of each plane.
+        latest (list): The latest landing time of each plane.
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        tuple: A tuple containing two lists aligned with pairs:
+            - separations: S_ij for each pair.
+            - gaps: L_i - E_j for each pair.
+    """
+    if not pairs:
+        return [], []
+
+    E = np.asarray(earliest, dtype=np.int64)
+    L = np.asarray(latest, dtype=np.int64)
+    S = np.asarray(separation_times, dtype=np.int64)
+    I, J = np.asarray(pairs, dtype=np.int64).T
+
+    return S[I, J].tolist(), (L[I] - E[J]).tolist()
+
+
+def min_separations(separation_times):
+    """
+    Computes the smallest separation each plane needs from any following plane.
+
+    Each landing occupies its runway for at least that long, so on one runway intervals
+    of this size never overlap. A NoOverlap constraint over them relaxes the separation
+    constraints (the separation times are asymmetric), but CP-SAT propagates it with
+    edge-finding / not-first / not-last reasoning, so the models add it as a redundant
+    constraint.
+
+    Args:
+        separation_times (np.ndarray or list of lists): The separation times.
+
+    Returns:
+        list: The smallest off-diagonal separation of each row, 0 for a lone plane.
+    """
+    separations = np.asarray(separation_times, dtype=np.int64)
+    num_planes = len(separations)
+    if num_planes < 2:
+        return [0] * num_planes
+
+    # Mask the diagonal so a plane is never separated from itself
+    masked = np.where(
+        np.eye(num_planes, dtype=bool), np.iinfo(np.int64).max, separations
+    )
+    return masked.min(axis=1).tolist()
+
+
+def add_precedences(model, precedences):
+    """
+    Posts landing_time[after] >= landing_time[before] + separation constraints by
+    appending them to the model proto directly, without building a LinearExpr for each.
+
+    Args:
+        model (cp_model.CpModel): The CP-SAT model.
+        precedences (list): (before, after, separation, literals) tuples, where before
+            and after are integer variables and literals enforce the constraint.
+    """
+    constraints = model.Proto().constraints
+    for before, after, separation, literals in precedences:
+        constraint = constraints.add()
+        constraint.enforcement_literal.extend(literal.Index() for literal in literals)
+        constraint.linear.vars.extend((after.Index(), before.Index()))
+        constraint.linear.coeffs.extend((1, -1))
+        constraint.linear.domain.extend((separation, cp_model.INT_MAX))
+
+
+def satisfies_triangle_inequality(separation_times):
+    """
+    Checks whether S_ik <= S_ij + S_jk holds for every three distinct planes.
+
+    When it holds, separating consecutive landings is enough to separate every pair.
+
+    Args:
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        bool: True if the separation times satisfy the triangle inequality.
+    """
+    S = np.asarray(separation_times, dtype=np.int64)
+    n = S.shape[0]
+    off_diagonal = ~np.eye(n, dtype=bool)
+
+    for j in range(n):
+        # S[i, j] + S[j, k] for every (i, k), ignoring i == j, k == j and i == k
+        through_j = S[:, j, None] + S[None, j, :]
+        violated = (S > through_j) & off_diagonal
+        violated[j, :] = False
+        violated[:, j] = False
+        if violated.any():
+            return False
+
+    return True
+
+
+def greedy_schedule(planes_data, separation_times, num_runways=1):
+    """
+    Builds a first-come-first-served schedule to warm start the solvers.
+
+    Planes are taken by target landing time and each one is given the runway where it can
+    land the soonest, at its target time or as soon as the separation from every plane
+    already on that runway allows.
+
+    Args:
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+        num_runways (int): The number of runways.
+
+    Returns:
+        tuple: A tuple containing:
+            - landing_times (list): The landing time of each plane.
+            - runways (list): The runway of each plane.
+        The schedule always separates planes on the same runway, but a plane may be
+        pushed past its latest landing time on congested instances.
+    """
+    separation_times = separation_rows(separation_times)
+    num_planes = len(planes_data)
+    order = sorted(
+        range(num_planes), key=lambda i: planes_data[i]["target_landing_time"]
+    )
+
+    landing_times = [0] * num_planes
+    runways = [0] * num_planes
+    scheduled = [[] for _ in range(num_runways)]
+
+    for i in order:
+        target_i = planes_data[i]["target_landing_time"]
+        best_time, best_runway = None, 0
+        for r in range(num_runways):
+            time_r = max(
+                [target_i]
+                + [landing_times[k] + separation_times[k][i] for k in scheduled[r]]
+            )
+            if best_time is None or time_r < best_time:
+                best_time, best_runway = time_r, r
+        landing_times[i] = best_time
+        runways[i] = best_runway
+        scheduled[best_runway].append(i)
+
+    return landing_times, runways
+
+
+def interchangeable_planes(planes_data, separation_times):
+    """
+    Groups planes that can swap their landing slots without changing any cost or constraint.
+
+    Two planes are interchangeable when they share the same time window, target and
+    penalties, and the same separation times to and from every other plane.
+
+    Args:
+        planes_data (list): A list of dictionaries containing plane data.
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        list: The groups of at least two interchangeable planes, each sorted by index.
+    """
+    separation_times = separation_rows(separation_times)
+    num_planes = len(planes_data)
+
+    def interchangeable(i, j):
+        if separation_times[i][j] != separation_times[j][i]:
+            return False
+        return all(
+            separation_times[i][k] == separation_times[j][k]
+            and separation_times[k][i] == separation_times[k][j]
+            for k in range(num_planes)
+            if k != i and k != j
+        )
+
+    buckets = {}
+    for i, p in enumerate(planes_data):
+        key = (
+            p["earliest_landing_time"],
+            p["target_landing_time"],
+            p["latest_landing_time"],
+            p["penalty_early"],
+            p["penalty_late"],
+        )
+        buckets.setdefault(key, []).append(i)
+
+    groups = []
+    for members in buckets.values():
+        bucket_groups = []
+        for i in members:
+            for group in bucket_groups:
+                if all(interchangeable(i, j) for j in group):
+                    group.append(i)
+                    break
+            else:
+                bucket_groups.append([i])
+        groups.extend(group for group in bucket_groups if len(group) > 1)
+
+    return groups
+
+
+def impossible_orders(earliest, latest, separation_times):
+    """
+    Finds the ordered pairs (i, j) where plane i can never land before plane j on the
+    same runway, because even landing i as early as possible, E_i + S_ij > L_j.
+
+    Args:
+        earliest (list): The earliest landing time of each plane.
+        latest (list): The latest landing time of each plane.
+        separation_times (list of lists): A 2D list of separation times.
+
+    Returns:
+        set: The (i, j) pairs where i cannot precede j.
+    """
+    E = np.asarray(earliest, dtype=np.int64)
+    L = np.asarray(latest, dtype=np.int64)
+    S = np.asarray(separation_times, dtype=np.int64)
+
+    impossible = E[:, None] + S > L[None, :]
+    np.fill_diagonal(impossible, False)
+
+    return {tuple(pair) for pair in np.argwhere(impossible).tolist()}
@@ -1,10 +1,91 @@
+import os
+
+import matplotlib as mpl
+from matplotlib.collections import LineCollection
 import matplotlib.lines as mlines
 import matplotlib.pyplot as plt
-from .utils import get_value
+import numpy as np
+
+from .utils import extract_plane_arrays, get_value_lists
+
+# Batch exports can pick a non-interactive backend without touching the notebooks,
+# e.g. ALS_PLOT_BACKEND=Agg or ALS_PLOT_BACKEND=module://mplcairo.base. Without a
+# display matplotlib already falls back to Agg on its own.
+if os.environ.get("ALS_PLOT_BACKEND"):
+    mpl.use(os.environ["ALS_PLOT_BACKEND"])
+
+LABEL_FONT_SIZE = 12
+TITLE_FONT_SIZE = 16
+LEGEND_FONT_SIZE = 10
+
+# Define a harmonious color palette
+COLOR_TARGET = "#4c72b0"
+COLOR_OPTIMAL = "#55a868"
+COLOR_EARLY_DEV = "#c44e52"
+COLOR_LATE_DEV = "#dd8452"
+COLOR_OPTIMAL_EQUAL_TARGET = "#8172b3"
+COLOR_EARLIEST_LATEST = "#646464"
+
+# Legend entries as (style, label), built into proxies once since they never change
+_LEGEND_SPECS = [
+    (dict(color="lightgray", linewidth=5), "Available Time Range"),
+    (
+        dict(color=COLOR_EARLIEST_LATEST, marker="^", linestyle="None", markersize=8),
+        r"Earliest Time ($E_i$)",
+    ),
+    (
+        dict(color=COLOR_EARLIEST_LATEST, marker="v", linestyle="None", markersize=8),
+        r"Latest Time ($L_i$)",
+    ),
+    (
+        dict(color=COLOR_TARGET, marker="o", linestyle="None", markersize=4),
+        r"Target Landing Time ($T_i$)",
+    ),
+    (
+        dict(color=COLOR_OPTIMAL, marker="x", linestyle="None", markersize=8),
+        r"Optimal Landing Time ($x_i$)",
+    ),
+    (
+        dict(
+            color=COLOR_OPTIMAL_EQUAL_TARGET, marker="*", linestyle="None", markersize=8
+        ),
+        r"Optimal = Target ($x_i=T_i$)",
+    ),
+    (dict(color=COLOR_EARLY_DEV, linewidth=8), r"Early Deviation ($\alpha_i$)"),
+    (dict(color=COLOR_LATE_DEV, linewidth=8), r"Late Deviation ($\beta_i$)"),
+    (dict(color="none"), r"Penalty values are shown below the deviation."),
+]
+_LEGEND_HANDLES = [
+    mlines.Line2D([], [], **style, label=label) for style, label in _LEGEND_SPECS
+]
 
-def visualize_solution(solver, num_planes, planes_data, variables, approach):
+
+def _segments(start, end, y):
     """
-    Visualizes the landing times for each plane with labels, with improved aesthetics.
+    Packs horizontal segments into the (n, 2, 2) array expected by LineCollection.
+
+    Args:
+        start (np.ndarray): The x-coordinate where each segment starts.
+        end (np.ndarray): The x-coordinate where each segment ends.
+        y (np.ndarray): The y-coordinate of each segment.
+
+    Returns:
+        np.ndarray: The segments as pairs of (x, y) points.
+    """
+    segments = np.empty((len(y), 2, 2))
+    segments[:, 0, 0] = start
+    segments[:, 1, 0] = end
+    segments[:, :, 1] = np.asarray(y)[:, None]
+    return segments
+
+
+# Above this many planes the bars are rasterized instead of drawn as vector paths
+_RASTERIZE_ABOVE = 50
+
+
+def _compute_plot_spec(solver, num_planes, planes_data, variables, approach):
+    """
+    Computes everything the schedule plot draws, without touching matplotlib.
 
     Args:
         solver (CP-SAT solver): The CP-SAT solver instance.
@@ -12,25 +93,190 @@ def visualize_solution(solver, num_planes, planes_data, variables, approach):
         planes_data (list): A list of dictionaries containing plane data.
         variables (dict): A dictionary containing the decision variables.
         approach (str): The approach used to solve the problem.
+
+    Returns:
+        dict: A dictionary containing the plot data, with planes sorted by landing time:
+            - plane_order: the plane indices from top to bottom.
+            - gray_segments, early_segments, late_segments: the bar segments.
+            - on_target_points, target_points, optimal_points, earliest_points,
+              latest_points: the (x, y) marker coordinates.
+            - labels: the (x, y, text, va, fontsize, color) of each label.
+            - xlim: the x-axis limits.
     """
+    # Read the solution once, then sort planes by optimal landing time
+    landing_times, early_deviations, late_deviations = np.array(
+        get_value_lists(
+            [
+                variables["landing_time"],
+                variables["early_deviation"],
+                variables["late_deviation"],
+            ],
+            approach,
+            solver,
+        ),
+        dtype=float,
+    )
+    plane_order = np.argsort(landing_times, kind="stable")
+
+    # Gather the plane data into one (5, n) array in a single pass, then reorder every
+    # column by landing time at once, so the rows follow directly
+    earliest, targets, latest, penalty_early, penalty_late = np.array(
+        extract_plane_arrays(planes_data), dtype=float
+    )[:, plane_order]
+    landing_times = landing_times[plane_order]
+    penalties = (
+        early_deviations[plane_order] * penalty_early
+        + late_deviations[plane_order] * penalty_late
+    )
+
+    # The first plane to land is drawn at the top
+    y_coords = np.arange(num_planes - 1, -1, -1)
+
+    # The axis extent is known before plotting, so every plane is judged against the
+    # same latest-time cutoff
+    max_optimal_time = float(landing_times[-1])
+    min_earliest_time = float(earliest.min())
+    latest_cutoff = max_optimal_time + 0.05 * max_optimal_time
 
-    LABEL_FONT_SIZE = 12
-    TITLE_FONT_SIZE = 16
-    LEGEND_FONT_SIZE = 10
+    # Split the planes by how they land relative to their target
+    on_target = np.abs(targets - landing_times) < 1e-6
+    off_target = ~on_target
+    early = off_target & (landing_times < targets)
+    late = off_target & (landing_times > targets)
+    show_latest = latest <= latest_cutoff
 
-    # Define a harmonious color palette
-    COLOR_TARGET = "#4c72b0"
-    COLOR_OPTIMAL = "#55a868"
-    COLOR_EARLY_DEV = "#c44e52"
-    COLOR_LATE_DEV = "#dd8452"
-    COLOR_OPTIMAL_EQUAL_TARGET = "#8172b3"
-    COLOR_EARLIEST_LATEST = "#646464"
+    # The time ranges as background bars, and the deviation lines
+    gray_segments = _segments(earliest, latest, y_coords)
+    early_segments = _segments(landing_times[early], targets[early], y_coords[early])
+    late_segments = _segments(targets[late], landing_times[late], y_coords[late])
+
+    # Special symbol for landing on target, otherwise both times are marked
+    on_target_points = (landing_times[on_target], y_coords[on_target])
+    target_points = (targets[off_target], y_coords[off_target])
+    optimal_points = (landing_times[off_target], y_coords[off_target])
+    earliest_points = (earliest, y_coords)
+    latest_points = (latest[show_latest], y_coords[show_latest])
+
+    # The label strings of each row, formatted once
+    x_labels = [f"$x_{{{i}}}$" for i in plane_order]
+    t_labels = [f"$T_{{{i}}}$" for i in plane_order]
+    e_labels = [f"$E_{{{i}}}$" for i in plane_order]
+    l_labels = [f"$L_{{{i}}}$" for i in plane_order]
+
+    labels = []  # (x, y, text, va, fontsize, color)
+    for k in np.flatnonzero(on_target):
+        labels.append(
+            (
+                landing_times[k],
+                y_coords[k] + 0.15,
+                x_labels[k],
+                "bottom",
+                LABEL_FONT_SIZE,
+                COLOR_OPTIMAL_EQUAL_TARGET,
+            )
+        )
+    for k in np.flatnonzero(off_target):
+        labels.append(
+            (
+                targets[k],
+                y_coords[k] + 0.15,
+                t_labels[k],
+                "bottom",
+                LABEL_FONT_SIZE,
+                COLOR_TARGET,
+            )
+        )
+        labels.append(
+            (
+                landing_times[k],
+                y_coords[k] + 0.15,
+                x_labels[k],
+                "bottom",
+                LABEL_FONT_SIZE,
+                COLOR_OPTIMAL,
+            )
+        )
+
+    # Add penalty labels, skipping penalties of 0.0
+    for k in np.flatnonzero(off_target & (penalties > 1e-6)):
+        labels.append(
+            (
+                (landing_times[k] + targets[k]) / 2,
+                y_coords[k] - 0.25,
+                f"{penalties[k]:.1f}",
+                "center",
+                LABEL_FONT_SIZE - 2,
+                "black",
+            )
+        )
+
+    for k in range(num_planes):
+        labels.append(
+            (
+                earliest[k],
+                y_coords[k] - 0.15,
+                e_labels[k],
+                "top",
+                LABEL_FONT_SIZE,
+                COLOR_EARLIEST_LATEST,
+            )
+        )
+    for k in np.flatnonzero(show_latest):
+        labels.append(
+            (
+                latest[k],
+                y_coords[k] - 0.15,
+                l_labels[k],
+                "top",
+                LABEL_FONT_SIZE,
+                COLOR_EARLIEST_LATEST,
+            )
+        )
+
+    return {
+        "plane_order": plane_order,
+        "gray_segments": gray_segments,
+        "early_segments": early_segments,
+        "late_segments": late_segments,
+        "on_target_points": on_target_points,
+        "target_points": target_points,
+        "optimal_points": optimal_points,
+        "earliest_points": earliest_points,
+        "latest_points": latest_points,
+        "labels": labels,
+        "xlim": (min_earliest_time - 0.1 * min_earliest_time, latest_cutoff),
+    }
+
+
+def _render(spec, ax=None, show=True, save_path=None):
+    """
+    Draws a plot spec from _compute_plot_spec.
+
+    Args:
+        spec (dict): The plot data from _compute_plot_spec.
+        ax (matplotlib.axes.Axes): The axes to draw on, cleared first. A new figure is
+            created when None.
+        show (bool): Whether to call plt.show(). Otherwise the redraw is only scheduled.
+        save_path (str): If given, the figure is saved there instead of being shown, and
+            closed when it was created here.
+    """
+    num_planes = len(spec["plane_order"])
 
-    plt.figure(figsize=(17, num_planes * 0.65))
-    ax = plt.gca()
-    plt.xlabel("Time", fontsize=LABEL_FONT_SIZE)
-    plt.ylabel("Planes", fontsize=LABEL_FONT_SIZE)
-    plt.title("Plane Landing Schedule", fontsize=TITLE_FONT_SIZE, fontweight="bold")
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(17, num_planes * 0.65))
+    else:
+        fig = ax.figure
+        ax.clear()
+
+    # Both limits are known up front, so adding artists never triggers an autoscale
+    ax.set_autoscale_on(False)
+    ax.set_xlim(*spec["xlim"])
+    ax.set_ylim(-0.5, num_planes - 0.5)
+
+    ax.set_xlabel("Time", fontsize=LABEL_FONT_SIZE)
+    ax.set_ylabel("Planes", fontsize=LABEL_FONT_SIZE)
+    ax.set_title("Plane Landing Schedule", fontsize=TITLE_FONT_SIZE, fontweight="bold")
 
     # Remove plot frame
     ax.spines["top"].set_visible(False)
@@ -38,259 +284,132 @@ def visualize_solution(solver, num_planes, planes_data, variables, approach):
     ax.spines["bottom"].set_visible(False)
     ax.spines["left"].set_visible(False)
 
-    # Sort planes by optimal landing time
-    plane_order = sorted(
-        range(num_planes), key=lambda i: get_value(variables["landing_time"][i], approach, solver)
-    )
-
     # Set y-axis ticks and labels based on the sorted order
-    plt.yticks(
-        range(num_planes), [f"Plane {plane_order[i]}" for i in range(num_planes)]
+    ax.set_yticks(
+        range(num_planes), [f"Plane {plane}" for plane in spec["plane_order"]]
     )
 
     ax.tick_params(axis="y", length=0)
 
-    plt.xticks([])
+    ax.set_xticks([])
 
     # Adjust plot margins
-    plt.subplots_adjust(left=0.1, right=0.8, top=0.9, bottom=0.1)
-
-    max_optimal_time = 0
-    min_earliest_time = float("inf")
+    fig.subplots_adjust(left=0.1, right=0.8, top=0.9, bottom=0.1)
 
-    # Define legend handles
-    legend_handles = [
-        mlines.Line2D(
-            [], [], color="lightgray", linewidth=5, label="Available Time Range"
-        ),
-        plt.Line2D(
-            [],
-            [],
-            color=COLOR_EARLIEST_LATEST,
-            marker="^",
-            linestyle="None",
-            markersize=8,
-            label=r"Earliest Time ($E_i$)",
-        ),
-        plt.Line2D(
-            [],
-            [],
-            color=COLOR_EARLIEST_LATEST,
-            marker="v",
-            linestyle="None",
-            markersize=8,
-            label=r"Latest Time ($L_i$)",
-        ),
-        plt.Line2D(
-            [],
-            [],
-            color=COLOR_TARGET,
-            marker="o",
-            linestyle="None",
-            markersize=4,
-            label=r"Target Landing Time ($T_i$)",
-        ),
-        plt.Line2D(
-            [],
-            [],
-            color=COLOR_OPTIMAL,
-            marker="x",
-            linestyle="None",
-            markersize=8,
-            label=r"Optimal Landing Time ($x_i$)",
-        ),
-        plt.Line2D(
-            [],
-            [],
-            color=COLOR_OPTIMAL_EQUAL_TARGET,
-            marker="*",
-            linestyle="None",
-            markersize=8,
-            label=r"Optimal = Target ($x_i=T_i$)",
-        ),
-        mlines.Line2D(
-            [],
-            [],
-            color=COLOR_EARLY_DEV,
-            linewidth=8,
-            label=r"Early Deviation ($\alpha_i$)",
-        ),
-        mlines.Line2D(
-            [],
-            [],
-            color=COLOR_LATE_DEV,
-            linewidth=8,
-            label=r"Late Deviation ($\beta_i$)",
-        ),
-        mlines.Line2D(
-            [], [], color="none", label=r"Penalty values are shown below the deviation."
-        ),
-    ]
-
-    # for i in range(num_planes):
-    for index, i in enumerate(plane_order):
-        earliest = planes_data[i]["earliest_landing_time"]
-        latest = planes_data[i]["latest_landing_time"]
-        target = planes_data[i]["target_landing_time"]
-        # optimal = variables["landing_time"][i].solution_value()
-        optimal = get_value(variables["landing_time"][i], approach, solver)
-        max_optimal_time = max(max_optimal_time, optimal)
-        min_earliest_time = min(min_earliest_time, earliest)
-        # early_dev = variables["early_deviation"][i].solution_value()
-        early_dev = get_value(variables["early_deviation"][i], approach, solver)
-        # late_dev = variables["late_deviation"][i].solution_value()
-        late_dev = get_value(variables["late_deviation"][i], approach, solver)
-        penalty = (
-            early_dev * planes_data[i]["penalty_early"]
-            + late_dev * planes_data[i]["penalty_late"]
+    # Labels stay out of the layout computation, so no layout pass measures every
+    # glyph
+    for x, y, text, va, fontsize, color in spec["labels"]:
+        ax.text(
+            x,
+            y,
+            text,
+            ha="center",
+            va=va,
+            fontsize=fontsize,
+            color=color,
+            zorder=3,
+            clip_on=False,
+            in_layout=False,
         )
 
-        # y_coord = num_planes - i - 1
-        y_coord = num_planes - 1 - index
-
-        # Plotting the time ranges as a background bar
-        plt.hlines(
-            y=y_coord,
-            xmin=earliest,
-            xmax=latest,
-            color="lightgray",
-            linewidth=5,
-            label="_nolegend_",
+    rasterized = num_planes > _RASTERIZE_ABOVE
+    ax.add_collection(
+        LineCollection(
+            spec["gray_segments"],
+            colors="lightgray",
+            linewidths=5,
             zorder=1,
+            rasterized=rasterized,
         )
-
-        # Plot the deviation lines
-        if abs(target - optimal) >= 1e-6:
-            if optimal < target:  # Early deviation
-                plt.hlines(
-                    y=y_coord,
-                    xmin=optimal,
-                    xmax=target,
-                    color=COLOR_EARLY_DEV,
-                    linewidth=8,
-                    zorder=2,
-                    label="_nolegend_",
-                )
-            elif optimal > target:  # Late deviation
-                plt.hlines(
-                    y=y_coord,
-                    xmin=target,
-                    xmax=optimal,
-                    color=COLOR_LATE_DEV,
-                    linewidth=8,
-                    zorder=2,
-                    label="_nolegend_",
-                )
-
-        if abs(target - optimal) < 1e-6:  # Check if target and optimal are very close
-            # Special symbol for landing on target
-            plt.scatter(
-                optimal,
-                y_coord,
-                color=COLOR_OPTIMAL_EQUAL_TARGET,
-                marker="*",
-                s=150,
-                zorder=3,
-            )
-            plt.text(
-                optimal,
-                y_coord + 0.15,
-                r"$x_{" + str(i) + "}$",
-                ha="center",
-                va="bottom",
-                fontsize=LABEL_FONT_SIZE,
-                color=COLOR_OPTIMAL_EQUAL_TARGET,
-                zorder=3,
-            )
-        else:
-            # Plotting and labeling the times if not on target
-            plt.scatter(target, y_coord, color=COLOR_TARGET, marker="o", s=50, zorder=3)
-            plt.text(
-                target,
-                y_coord + 0.15,
-                r"$T_{" + str(i) + "}$",
-                ha="center",
-                va="bottom",
-                fontsize=LABEL_FONT_SIZE,
-                color=COLOR_TARGET,
-                zorder=3,
-            )
-
-            plt.scatter(
-                optimal, y_coord, color=COLOR_OPTIMAL, marker="x", s=100, zorder=3
-            )
-            plt.text(
-                optimal,
-                y_coord + 0.15,
-                r"$x_{" + str(i) + "}$",
-                ha="center",
-                va="bottom",
-                fontsize=LABEL_FONT_SIZE,
-                color=COLOR_OPTIMAL,
-                zorder=3,
-            )
-
-            # Add penalty labels
-            if penalty > 1e-6:  # Prevent displaying penalty of 0.0
-                mid_x = (optimal + target) / 2
-                plt.text(
-                    mid_x,
-                    y_coord - 0.25,
-                    f"{penalty:.1f}",
-                    ha="center",
-                    va="center",
-                    fontsize=LABEL_FONT_SIZE - 2,
-                    color="black",
-                    zorder=3,
-                )
-
-        plt.text(
-            earliest,
-            y_coord - 0.15,
-            r"$E_{" + str(i) + "}$",
-            ha="center",
-            va="top",
-            fontsize=LABEL_FONT_SIZE,
-            color=COLOR_EARLIEST_LATEST,
-            zorder=3,
+    )
+    ax.add_collection(
+        LineCollection(
+            spec["early_segments"],
+            colors=COLOR_EARLY_DEV,
+            linewidths=8,
+            zorder=2,
+            rasterized=rasterized,
         )
-        plt.scatter(
-            earliest, y_coord, color=COLOR_EARLIEST_LATEST, marker="^", s=100, zorder=3
+    )
+    ax.add_collection(
+        LineCollection(
+            spec["late_segments"],
+            colors=COLOR_LATE_DEV,
+            linewidths=8,
+            zorder=2,
+            rasterized=rasterized,
         )
-        # Conditionally plot the latest time
-        if latest <= max_optimal_time + 0.05 * max_optimal_time:
-            plt.scatter(
-                latest,
-                y_coord,
-                color=COLOR_EARLIEST_LATEST,
-                marker="v",
-                s=100,
-                zorder=3,
-            )
-            plt.text(
-                latest,
-                y_coord - 0.15,
-                r"$L_{" + str(i) + "}$",
-                ha="center",
-                va="top",
-                fontsize=LABEL_FONT_SIZE,
-                color=COLOR_EARLIEST_LATEST,
-                zorder=3,
-            )
+    )
 
-    # Adjusting the x-axis limits
-    plt.xlim(
-        left=min_earliest_time - 0.1 * min_earliest_time,
-        right=max_optimal_time + 0.05 * max_optimal_time,
+    ax.scatter(
+        *spec["on_target_points"],
+        color=COLOR_OPTIMAL_EQUAL_TARGET,
+        marker="*",
+        s=150,
+        zorder=3,
+    )
+    ax.scatter(*spec["target_points"], color=COLOR_TARGET, marker="o", s=50, zorder=3)
+    ax.scatter(
+        *spec["optimal_points"], color=COLOR_OPTIMAL, marker="x", s=100, zorder=3
+    )
+    ax.scatter(
+        *spec["earliest_points"],
+        color=COLOR_EARLIEST_LATEST,
+        marker="^",
+        s=100,
+        zorder=3,
+    )
+    ax.scatter(
+        *spec["latest_points"], color=COLOR_EARLIEST_LATEST, marker="v", s=100, zorder=3
     )
 
-    plt.legend(
-        handles=legend_handles,
+    ax.legend(
+        handles=_LEGEND_HANDLES,
         loc="center left",
         bbox_to_anchor=(1.05, 0.5),
         fontsize=LEGEND_FONT_SIZE,
         title="Legend",
     )
 
-    plt.tight_layout(pad=2)
-    plt.show()
+    if save_path:
+        fig.savefig(save_path, bbox_inches="tight")
+        if owns_figure:
+            # Release the figure so batch exports do not pile up in pyplot
+            plt.close(fig)
+    elif show:
+        plt.show()
+    else:
+        fig.canvas.draw_idle()
+
+
+def visualize_solution(
+    solver,
+    num_planes,
+    planes_data,
+    variables,
+    approach,
+    ax=None,
+    show=True,
+    save_path=None,
+):
+    """
+    Visualizes the landing times for each plane with labels, with improved aesthetics.
+
+    Args:
+        solver (CP-SAT solver): The CP-SAT solver instance.
+        num_planes (int): The number of planes.
+        planes_data (list): A list of dictionaries containing plane data.
+        variables (dict): A dictionary containing the decision variables.
+        approach (str): The approach used to solve the problem.
+        ax (matplotlib.axes.Axes): The axes to draw on, cleared first. A new figure is
+            created when None, so repeated plots can reuse one figure.
+        show (bool): Whether to call plt.show(). Otherwise the redraw is only scheduled.
+        save_path (str): If given, the figure is saved there instead of being shown, and
+            closed when it was created here.
+    """
+
+    if num_planes == 0:
+        return
+
+    spec = _compute_plot_spec(solver, num_planes, planes_data, variables, approach)
+    _render(spec, ax=ax, show=show, save_path=save_path)
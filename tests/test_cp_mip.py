@@ -0,0 +1,47 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@unittest.skipUnless(importlib.util.find_spec("ortools"), "ortools is not installed")
+class EmptyWindowTest(unittest.TestCase):
+    def test_tightened_empty_window_is_infeasible(self):
+        """
+        With windows [0, 10] and [20, 25] and a separation of 30, propagating the Set V
+        pair empties the second window. The model must stay valid and be infeasible.
+        """
+        from ALS.CP_MIP import solve_cp_sat_model_single_runway
+
+        planes_data = [
+            {
+                "appearance_time": 0,
+                "earliest_landing_time": 0,
+                "target_landing_time": 5,
+                "latest_landing_time": 10,
+                "penalty_early": 1.0,
+                "penalty_late": 1.0,
+            },
+            {
+                "appearance_time": 0,
+                "earliest_landing_time": 20,
+                "target_landing_time": 22,
+                "latest_landing_time": 25,
+                "penalty_early": 1.0,
+                "penalty_late": 1.0,
+            },
+        ]
+        separation_times = [[0, 30], [30, 0]]
+
+        solver, model, _ = solve_cp_sat_model_single_runway(
+            2, planes_data, separation_times, num_workers=1
+        )
+
+        self.assertEqual(model.Validate(), "")
+        self.assertEqual(solver.StatusName(), "INFEASIBLE")
+
+
+if __name__ == "__main__":
+    unittest.main()